@@ -9,11 +9,13 @@ Usage:
 
 import os
 import sys
-import glob
 import shutil
 import platform
 import subprocess
 import argparse
+import functools
+from importlib import metadata
+from concurrent.futures import ThreadPoolExecutor
 
 
 # --------------------------------------------------------------
@@ -48,6 +50,7 @@ VLC_SEARCH_MAC = [
 # Helpers
 # --------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1)
 def find_vlc_dir() -> str:
     """Locate VLC installation directory."""
     search = VLC_SEARCH_WIN if sys.platform == "win32" else VLC_SEARCH_MAC
@@ -62,12 +65,12 @@ def find_vlc_dir() -> str:
                 if os.path.isdir(lib_dir):
                     return path
                 # Also check if libvlc is directly here
-                for f in os.listdir(path):
-                    if "libvlc" in f:
-                        return path
+                if any("libvlc" in f for f in os.listdir(path)):
+                    return path
     return ""
 
 
+@functools.lru_cache(maxsize=1)
 def find_ffmpeg() -> str:
     """Locate FFmpeg binary."""
     # Check bundled location first
@@ -79,14 +82,51 @@ def find_ffmpeg() -> str:
         return os.path.abspath(local)
 
     # Check system PATH
-    cmd = "where" if sys.platform == "win32" else "which"
-    try:
-        result = subprocess.run([cmd, "ffmpeg"], capture_output=True, text=True)
-        if result.returncode == 0:
-            return result.stdout.strip().split("\n")[0].strip()
-    except Exception:
-        pass
-    return ""
+    return shutil.which("ffmpeg") or ""
+
+
+def fast_copy(src: str, dst: str) -> str:
+    """Copy a file like shutil.copy2 and return the destination path.
+    On Windows the copy is done by CopyFileExW in the kernel; elsewhere
+    copy2 already uses sendfile/fcopyfile."""
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+    if sys.platform == "win32":
+        import ctypes
+        if ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+            return dst
+    return shutil.copy2(src, dst)
+
+
+def copy_tree_parallel(src: str, dest: str) -> list:
+    """Copy a directory tree with the per-file copies spread over a thread
+    pool. Symlinks are resolved, like shutil.copytree(symlinks=False).
+    Returns the destination paths of the copied files."""
+    pairs = []
+    for root, _, files in os.walk(src, followlinks=True):
+        target = os.path.join(dest, os.path.relpath(root, src))
+        os.makedirs(target, exist_ok=True)
+        pairs.extend((os.path.join(root, f), os.path.join(target, f)) for f in files)
+
+    # Plugin trees are hundreds of small files, so this is syscall-bound
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda pair: fast_copy(*pair), pairs))
+
+
+def tree_size(root: str) -> int:
+    """Total size in bytes of the files under root, using the stat data
+    scandir already has instead of a separate stat per file."""
+    total = 0
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    total += entry.stat(follow_symlinks=False).st_size
+    return total
 
 
 def copy_vlc_windows(vlc_dir: str, dest: str):
@@ -98,7 +138,7 @@ def copy_vlc_windows(vlc_dir: str, dest: str):
     for dll in ["libvlc.dll", "libvlccore.dll"]:
         src = os.path.join(vlc_dir, dll)
         if os.path.isfile(src):
-            shutil.copy2(src, vlc_dest)
+            fast_copy(src, vlc_dest)
             print(f"  Copied {dll}")
 
     # Plugins folder (required)
@@ -107,8 +147,8 @@ def copy_vlc_windows(vlc_dir: str, dest: str):
     if os.path.isdir(plugins_src):
         if os.path.isdir(plugins_dest):
             shutil.rmtree(plugins_dest)
-        shutil.copytree(plugins_src, plugins_dest)
-        plugin_count = sum(1 for _ in glob.glob(os.path.join(plugins_dest, "**", "*.dll"), recursive=True))
+        copied = copy_tree_parallel(plugins_src, plugins_dest)
+        plugin_count = sum(1 for path in copied if path.endswith(".dll"))
         print(f"  Copied plugins/ ({plugin_count} DLLs)")
 
 
@@ -126,14 +166,14 @@ def copy_vlc_mac(vlc_dir: str, dest: str):
                 real = os.path.realpath(full)
                 # Copy the real file with the symlink name
                 dest_file = os.path.join(vlc_dest, f)
-                shutil.copy2(real, dest_file)
+                fast_copy(real, dest_file)
                 print(f"  Copied {f}")
     else:
         # Fallback: check for dylibs directly in vlc_dir
         for f in os.listdir(vlc_dir):
             if f.endswith(".dylib") and "vlc" in f.lower():
                 real = os.path.realpath(os.path.join(vlc_dir, f))
-                shutil.copy2(real, os.path.join(vlc_dest, f))
+                fast_copy(real, os.path.join(vlc_dest, f))
                 print(f"  Copied {f}")
 
     # Plugins
@@ -145,9 +185,8 @@ def copy_vlc_mac(vlc_dir: str, dest: str):
         if os.path.isdir(plugins_dest):
             shutil.rmtree(plugins_dest)
         # Copy resolving symlinks
-        shutil.copytree(plugins_src, plugins_dest, symlinks=False)
-        plugin_count = sum(1 for _ in glob.glob(
-            os.path.join(plugins_dest, "**", "*.dylib"), recursive=True))
+        copied = copy_tree_parallel(plugins_src, plugins_dest)
+        plugin_count = sum(1 for path in copied if path.endswith(".dylib"))
         print(f"  Copied plugins/ ({plugin_count} dylibs)")
 
 
@@ -158,7 +197,7 @@ def copy_ffmpeg(ffmpeg_path: str, dest: str):
 
     out_name = "ffmpeg.exe" if sys.platform == "win32" else "ffmpeg"
     out_path = os.path.join(ffmpeg_dest, out_name)
-    shutil.copy2(ffmpeg_path, out_path)
+    fast_copy(ffmpeg_path, out_path)
 
     # Make executable on Unix
     if sys.platform != "win32":
@@ -183,29 +222,24 @@ def check_deps():
     # Python
     print(f"  Python:     {sys.version.split()[0]}  [OK]")
 
-    # PySide6
-    try:
-        import PySide6
-        print(f"  PySide6:    {PySide6.__version__}  [OK]")
-    except ImportError:
-        print(f"  PySide6:    NOT FOUND  [MISSING]  ->  pip install PySide6")
-        ok = False
-
-    # python-vlc
-    try:
-        import vlc
-        print(f"  python-vlc: {vlc.__version__ if hasattr(vlc, '__version__') else 'installed'}  [OK]")
-    except ImportError:
-        print(f"  python-vlc: NOT FOUND  [MISSING]  ->  pip install python-vlc")
-        ok = False
-
-    # PyInstaller
-    try:
-        import PyInstaller
-        print(f"  PyInstaller: {PyInstaller.__version__}  [OK]")
-    except ImportError:
-        print(f"  PyInstaller: NOT FOUND  [MISSING]  ->  pip install pyinstaller")
-        ok = False
+    # Python packages - read installed metadata instead of importing them,
+    # which would pull in Qt, libvlc and PyInstaller just to print versions
+    # PySide6 may be installed as just its Essentials wheel
+    for label, dists in [("PySide6:    ", ("PySide6", "PySide6-Essentials")),
+                         ("python-vlc: ", ("python-vlc",)),
+                         ("PyInstaller: ", ("pyinstaller",))]:
+        version = None
+        for dist in dists:
+            try:
+                version = metadata.version(dist)
+                break
+            except metadata.PackageNotFoundError:
+                continue
+        if version:
+            print(f"  {label}{version}  [OK]")
+        else:
+            print(f"  {label}NOT FOUND  [MISSING]  ->  pip install {dists[0]}")
+            ok = False
 
     # VLC binaries
     vlc_dir = find_vlc_dir()
@@ -336,10 +370,7 @@ def build():
             final_dir = mac_final
 
     # Summary
-    total_size = 0
-    for dirpath, dirnames, filenames in os.walk(final_dir):
-        for f in filenames:
-            total_size += os.path.getsize(os.path.join(dirpath, f))
+    total_size = tree_size(final_dir)
 
     print(f"\n{'='*60}")
     print(f"  BUILD SUCCESSFUL!")
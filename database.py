@@ -6,14 +6,125 @@ Supports both movies and TV shows.
 
 import sqlite3
 import os
+import atexit
+import threading
+from contextlib import contextmanager
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 
 from utils.paths import get_db_path
 
-
-@dataclass
+# Trigram tokenizer needs 3 characters to build a token
+_FTS_MIN_QUERY = 3
+
+# DELETE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Seconds to buffer playback position/duration writes before flushing
+_FLUSH_INTERVAL = 5.0
+
+# Stay below SQLite's default SQLITE_MAX_VARIABLE_NUMBER for IN (...) lists
+_IN_CHUNK = 900
+
+
+def _chunks(ids: list):
+    for i in range(0, len(ids), _IN_CHUNK):
+        yield ids[i:i + _IN_CHUNK]
+
+
+# Column lists follow the dataclass field order below, so a fetched row can
+# be passed positionally, e.g. Movie(*row).
+_MOVIE_COLUMNS = "id, title, movie_path, thumb_path, date_added, last_position, duration"
+_SHOW_COLUMNS = "id, title, thumb_path, date_added"
+_SEASON_COLUMNS = "id, show_id, season_number, date_added"
+_EPISODE_COLUMNS = ("id, season_id, episode_number, title, movie_path, "
+                    "last_position, duration, date_added")
+
+# ORDER BY clauses for every (sort_by, ascending) the library offers
+_ORDER_CLAUSES = {
+    ("title", True): "title COLLATE NOCASE ASC",
+    ("title", False): "title COLLATE NOCASE DESC",
+    ("date_added", True): "date_added ASC",
+    ("date_added", False): "date_added DESC",
+}
+
+
+def _order_key(sort_by: str, ascending: bool) -> tuple:
+    return ("title" if sort_by == "title" else "date_added", bool(ascending))
+
+
+def _search_statements(table: str, columns: str) -> dict:
+    """Build search SQL keyed by (use_fts, order key)."""
+    filters = {
+        True: f"id IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH ?)",
+        False: "title LIKE ?",
+    }
+    return {(use_fts, key): f"SELECT {columns} FROM {table} WHERE {where} ORDER BY {clause}"
+            for use_fts, where in filters.items()
+            for key, clause in _ORDER_CLAUSES.items()}
+
+
+# Statements are module constants so every call hands sqlite3 the same
+# string and hits its per-connection statement cache.
+_SQL_INSERT_MOVIE = "INSERT INTO movies (title, movie_path, thumb_path) VALUES (?, ?, ?)"
+_SQL_INSERT_SUBTITLE = """INSERT INTO subtitles (movie_id, sub_path, label, is_embedded, track_index)
+    VALUES (?, ?, ?, ?, ?)"""
+_SQL_GET_MOVIE = f"SELECT {_MOVIE_COLUMNS} FROM movies WHERE id = ?"
+_SQL_GET_MOVIE_SUBTITLES = "SELECT sub_path, label FROM subtitles WHERE movie_id = ?"
+_SQL_UPDATE_MOVIE_POSITION = "UPDATE movies SET last_position = ? WHERE id = ?"
+_SQL_UPDATE_MOVIE_DURATION = "UPDATE movies SET duration = ? WHERE id = ?"
+_SQL_DELETE_MOVIE = "DELETE FROM movies WHERE id = ?"
+_SQL_DELETE_MOVIE_RETURNING = f"DELETE FROM movies WHERE id = ? RETURNING {_MOVIE_COLUMNS}"
+_SQL_COUNT_MOVIES = "SELECT COUNT(*) as cnt FROM movies"
+_SQL_LIST_MOVIES = {key: f"SELECT {_MOVIE_COLUMNS} FROM movies ORDER BY {clause}"
+                    for key, clause in _ORDER_CLAUSES.items()}
+_SQL_SEARCH_MOVIES = _search_statements("movies", _MOVIE_COLUMNS)
+_SQL_INSERT_SHOW = "INSERT INTO shows (title, thumb_path) VALUES (?, ?)"
+_SQL_INSERT_SEASON = "INSERT INTO seasons (show_id, season_number) VALUES (?, ?)"
+_SQL_FIND_SEASON = "SELECT id FROM seasons WHERE show_id = ? AND season_number = ?"
+_SQL_COUNT_SEASON_EPISODES = "SELECT COUNT(*) as cnt FROM episodes WHERE season_id = ?"
+_SQL_INSERT_EPISODE = """INSERT INTO episodes (season_id, episode_number, title, movie_path)
+    VALUES (?, ?, ?, ?)"""
+_SQL_LATEST_EPISODE_IDS = "SELECT id FROM episodes WHERE season_id = ? ORDER BY id DESC LIMIT ?"
+_SQL_GET_SHOW = f"SELECT {_SHOW_COLUMNS} FROM shows WHERE id = ?"
+_SQL_COUNT_SHOWS = "SELECT COUNT(*) as cnt FROM shows"
+_SQL_LIST_SHOWS = {key: f"SELECT {_SHOW_COLUMNS} FROM shows ORDER BY {clause}"
+                   for key, clause in _ORDER_CLAUSES.items()}
+_SQL_SEARCH_SHOWS = _search_statements("shows", _SHOW_COLUMNS)
+_SQL_SHOW_TITLES = "SELECT id, title FROM shows ORDER BY title COLLATE NOCASE ASC"
+_SQL_MAX_SEASON = "SELECT MAX(season_number) as mx FROM seasons WHERE show_id = ?"
+_SQL_UPDATE_EPISODE_POSITION = "UPDATE episodes SET last_position = ? WHERE id = ?"
+_SQL_UPDATE_EPISODE_DURATION = "UPDATE episodes SET duration = ? WHERE id = ?"
+_SQL_DELETE_SHOW = "DELETE FROM shows WHERE id = ?"
+_SQL_DELETE_SHOW_RETURNING = f"DELETE FROM shows WHERE id = ? RETURNING {_SHOW_COLUMNS}"
+_SQL_RENAME_MOVIE = "UPDATE movies SET title = ? WHERE id = ?"
+_SQL_RENAME_SHOW = "UPDATE shows SET title = ? WHERE id = ?"
+_SQL_MOVIE_THUMBS = "SELECT id, thumb_path FROM movies"
+_SQL_SHOW_THUMBS = "SELECT id, thumb_path FROM shows"
+_SQL_UPDATE_MOVIE_THUMB = "UPDATE movies SET thumb_path = ? WHERE id = ?"
+_SQL_UPDATE_SHOW_THUMB = "UPDATE shows SET thumb_path = ? WHERE id = ?"
+_SQL_MOVIES_IN_PROGRESS = f"""SELECT {_MOVIE_COLUMNS} FROM movies
+    WHERE last_position > 0 AND duration > 0
+      AND (last_position / duration) < 0.95
+    ORDER BY date_added DESC"""
+_SQL_EPISODES_IN_PROGRESS = """SELECT e.id, e.season_id, e.episode_number, e.title, e.movie_path,
+           e.last_position, e.duration, e.date_added,
+           s.show_id, s.season_number, sh.title, sh.thumb_path
+    FROM episodes e
+    JOIN seasons s ON e.season_id = s.id
+    JOIN shows sh ON s.show_id = sh.id
+    WHERE e.last_position > 0 AND e.duration > 0
+      AND (e.last_position / e.duration) < 0.95
+    ORDER BY e.date_added DESC"""
+_SQL_LIBRARY_STATS = """SELECT (SELECT COUNT(*) FROM movies), (SELECT COUNT(*) FROM shows),
+           (SELECT COUNT(*) FROM seasons), (SELECT COUNT(*) FROM episodes)"""
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_SET_SETTING = "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)"
+
+
+@dataclass(slots=True)
 class Movie:
     """Represents a movie in the catalog."""
     id: int = 0
@@ -26,7 +137,7 @@ class Movie:
     subtitle_paths: list = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     """Represents a single TV show episode."""
     id: int = 0
@@ -39,7 +150,7 @@ class Episode:
     date_added: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Season:
     """Represents a season of a TV show."""
     id: int = 0
@@ -49,7 +160,7 @@ class Season:
     episodes: List[Episode] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Show:
     """Represents a TV show in the catalog."""
     id: int = 0
@@ -57,6 +168,8 @@ class Show:
     thumb_path: str = ""
     date_added: str = ""
     seasons: List[Season] = field(default_factory=list)
+    season_count: int = 0
+    episode_count: int = 0
 
 
 class Database:
@@ -64,17 +177,87 @@ class Database:
 
     def __init__(self, db_path: Optional[str] = None):
         self.db_path = db_path or get_db_path()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self._has_fts = False
+        # {sql: {row_id: value}} - only the latest value per row is kept
+        self._pending: dict = {}
+        self._flush_timer: Optional[threading.Timer] = None
         self._init_db()
+        atexit.register(self.flush)
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        """Return the long-lived connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=256)
+            # Per-connection settings; journal_mode is persisted by _init_db
+            conn.executescript("""
+                PRAGMA foreign_keys = ON;
+                PRAGMA synchronous = NORMAL;
+                PRAGMA temp_store = MEMORY;
+                PRAGMA cache_size = -64000;
+                PRAGMA mmap_size = 268435456;
+            """)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection under the lock.
+        Uncommitted work is rolled back if the block raises."""
+        with self._lock:
+            conn = self._get_conn()
+            # Reads must see buffered positions, so flush them first
+            if self._pending:
+                self._flush_pending(conn)
+            try:
+                yield conn
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _buffer_write(self, sql: str, row_id: int, value: float):
+        """Queue a single-column update, flushed within _FLUSH_INTERVAL."""
+        with self._lock:
+            self._pending.setdefault(sql, {})[row_id] = value
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_pending(self, conn: sqlite3.Connection):
+        pending, self._pending = self._pending, {}
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        try:
+            for sql, values in pending.items():
+                conn.executemany(sql, [(value, row_id) for row_id, value in values.items()])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def flush(self):
+        """Write any buffered playback positions and durations to disk."""
+        with self._lock:
+            if self._pending:
+                self._flush_pending(self._get_conn())
+
+    def close(self):
+        """Flush pending writes and close the shared connection.
+        Called once at app exit."""
+        with self._lock:
+            self.flush()
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def _init_db(self):
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
+            # WAL is stored in the database file, so it only needs setting once
+            conn.execute("PRAGMA journal_mode = WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS movies (
                     id          INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -127,487 +310,461 @@ class Database:
                     key   TEXT PRIMARY KEY,
                     value TEXT NOT NULL DEFAULT ''
                 );
+
+                CREATE INDEX IF NOT EXISTS idx_subs_movie ON subtitles(movie_id);
+                CREATE INDEX IF NOT EXISTS idx_eps_season ON episodes(season_id, episode_number);
+                CREATE INDEX IF NOT EXISTS idx_seasons_show ON seasons(show_id, season_number);
+                CREATE INDEX IF NOT EXISTS idx_movies_title_nocase ON movies(title COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_shows_title_nocase ON shows(title COLLATE NOCASE);
+                CREATE INDEX IF NOT EXISTS idx_movies_date_added ON movies(date_added);
+                CREATE INDEX IF NOT EXISTS idx_shows_date_added ON shows(date_added);
             """)
             conn.commit()
-        finally:
-            conn.close()
+        self._init_fts()
+
+    def _init_fts(self):
+        """Create trigram FTS5 indexes over movie and show titles so substring
+        search doesn't scan the table. Search falls back to LIKE if the SQLite
+        build lacks FTS5 or the trigram tokenizer."""
+        with self._connection() as conn:
+            try:
+                for table in ("movies", "shows"):
+                    fts = f"{table}_fts"
+                    # Triggers are missing if a build without FTS5 opened the
+                    # library since; the index then missed those writes
+                    in_sync = conn.execute(
+                        "SELECT COUNT(*) FROM sqlite_master WHERE "
+                        "(type = 'table' AND name = ?) OR (type = 'trigger' AND name = ?)",
+                        (fts, f"{fts}_ai")
+                    ).fetchone()[0] == 2
+                    conn.executescript(f"""
+                        CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                            title, content='{table}', content_rowid='id', tokenize='trigram'
+                        );
+                        CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                            INSERT INTO {fts}(rowid, title) VALUES (new.id, new.title);
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                            INSERT INTO {fts}({fts}, rowid, title) VALUES ('delete', old.id, old.title);
+                        END;
+                        CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF title ON {table} BEGIN
+                            INSERT INTO {fts}({fts}, rowid, title) VALUES ('delete', old.id, old.title);
+                            INSERT INTO {fts}(rowid, title) VALUES (new.id, new.title);
+                        END;
+                    """)
+                    if not in_sync:
+                        conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+                conn.commit()
+                self._has_fts = True
+            except sqlite3.OperationalError:
+                conn.rollback()
+                self._has_fts = False
+                # Triggers left by an FTS5-capable build would make every
+                # write fail with "no such module" on this one
+                conn.executescript("".join(
+                    f"DROP TRIGGER IF EXISTS {table}_fts_{suffix};"
+                    for table in ("movies", "shows") for suffix in ("ai", "ad", "au")))
+
+    def search_uses_fts(self, query: str) -> bool:
+        """True if a title search for query goes through the trigram index,
+        which matches it literally with Unicode case folding."""
+        return self._has_fts and len(query) >= _FTS_MIN_QUERY
+
+    def _title_filter(self, query: str):
+        """Return (use_fts, params) for matching titles that contain query."""
+        if self.search_uses_fts(query):
+            # Quote as an FTS phrase so user input is matched literally
+            return True, ('"' + query.replace('"', '""') + '"',)
+        return False, (f"%{query}%",)
 
     # ---- Movies ------------------------------------------------------------------------------------------
 
     def add_movie(self, title: str, movie_path: str, thumb_path: str,
                   subtitle_entries: list = None) -> int:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
-                "INSERT INTO movies (title, movie_path, thumb_path) VALUES (?, ?, ?)",
+                _SQL_INSERT_MOVIE,
                 (title, movie_path, thumb_path)
             )
             movie_id = cursor.lastrowid
             if subtitle_entries:
-                for sub in subtitle_entries:
-                    conn.execute(
-                        """INSERT INTO subtitles (movie_id, sub_path, label, is_embedded, track_index)
-                           VALUES (?, ?, ?, ?, ?)""",
-                        (movie_id, sub.get("sub_path", ""),
-                         sub.get("label", ""), sub.get("is_embedded", False),
-                         sub.get("track_index", 0))
-                    )
+                self._insert_subtitles(conn, movie_id, subtitle_entries)
             conn.commit()
             return movie_id
-        finally:
-            conn.close()
 
-    def get_all_movies(self, sort_by: str = "date_added", ascending: bool = False) -> list:
-        order = "ASC" if ascending else "DESC"
-        if sort_by == "title":
-            order_clause = f"LOWER(title) {order}"
-        else:
-            order_clause = f"date_added {order}"
-
-        conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                f"SELECT * FROM movies ORDER BY {order_clause}"
-            ).fetchall()
+    def add_subtitles(self, movie_id: int, subtitle_entries: list):
+        """Insert several subtitle entries for a movie in one transaction."""
+        if not subtitle_entries:
+            return
+        with self._connection() as conn:
+            self._insert_subtitles(conn, movie_id, subtitle_entries)
+            conn.commit()
 
-            movies = []
-            for row in rows:
-                movie = Movie(
-                    id=row["id"], title=row["title"],
-                    movie_path=row["movie_path"], thumb_path=row["thumb_path"],
-                    date_added=row["date_added"], last_position=row["last_position"],
-                    duration=row["duration"]
-                )
-                subs = conn.execute(
-                    "SELECT sub_path, label, is_embedded, track_index FROM subtitles WHERE movie_id = ?",
-                    (row["id"],)
-                ).fetchall()
-                movie.subtitle_paths = [(s["sub_path"], s["label"]) for s in subs]
-                movies.append(movie)
-            return movies
-        finally:
-            conn.close()
-
-    def search_movies(self, query: str, sort_by: str = "date_added", ascending: bool = False) -> list:
-        order = "ASC" if ascending else "DESC"
-        if sort_by == "title":
-            order_clause = f"LOWER(title) {order}"
-        else:
-            order_clause = f"date_added {order}"
-
-        conn = self._get_conn()
-        try:
+    def _insert_subtitles(self, conn, movie_id: int, subtitle_entries: list):
+        conn.executemany(
+            _SQL_INSERT_SUBTITLE,
+            [(movie_id, sub.get("sub_path", ""),
+              sub.get("label", ""), sub.get("is_embedded", False),
+              sub.get("track_index", 0)) for sub in subtitle_entries]
+        )
+
+    def get_all_movies(self, sort_by: str = "date_added", ascending: bool = False,
+                       with_subtitles: bool = True) -> list:
+        sql = _SQL_LIST_MOVIES[_order_key(sort_by, ascending)]
+        with self._connection() as conn:
+            cursor = conn.execute(sql)
+            if not with_subtitles:
+                return [Movie(*row) for row in cursor]
+            return self._build_movies(conn, cursor.fetchall())
+
+    def search_movies(self, query: str, sort_by: str = "date_added", ascending: bool = False,
+                      with_subtitles: bool = True) -> list:
+        use_fts, params = self._title_filter(query)
+        sql = _SQL_SEARCH_MOVIES[(use_fts, _order_key(sort_by, ascending))]
+        with self._connection() as conn:
+            cursor = conn.execute(sql, params)
+            if not with_subtitles:
+                return [Movie(*row) for row in cursor]
+            return self._build_movies(conn, cursor.fetchall())
+
+    def _build_movies(self, conn, rows) -> List[Movie]:
+        """Build Movie objects for rows, loading all their subtitles in bulk."""
+        subs_by_movie = self._get_subtitles(conn, [row[0] for row in rows])
+        return [Movie(*row, subtitle_paths=subs_by_movie.get(row[0], [])) for row in rows]
+
+    def _get_subtitles(self, conn, movie_ids: list) -> dict:
+        """Return {movie_id: [(sub_path, label), ...]} using one IN query per chunk."""
+        subs_by_movie = defaultdict(list)
+        for chunk in _chunks(movie_ids):
+            placeholders = ",".join("?" * len(chunk))
             rows = conn.execute(
-                f"SELECT * FROM movies WHERE title LIKE ? ORDER BY {order_clause}",
-                (f"%{query}%",)
+                f"SELECT movie_id, sub_path, label FROM subtitles "
+                f"WHERE movie_id IN ({placeholders}) ORDER BY id",
+                chunk
             ).fetchall()
-
-            movies = []
-            for row in rows:
-                movie = Movie(
-                    id=row["id"], title=row["title"],
-                    movie_path=row["movie_path"], thumb_path=row["thumb_path"],
-                    date_added=row["date_added"], last_position=row["last_position"],
-                    duration=row["duration"]
-                )
-                subs = conn.execute(
-                    "SELECT sub_path, label FROM subtitles WHERE movie_id = ?",
-                    (row["id"],)
-                ).fetchall()
-                movie.subtitle_paths = [(s["sub_path"], s["label"]) for s in subs]
-                movies.append(movie)
-            return movies
-        finally:
-            conn.close()
+            for movie_id, sub_path, label in rows:
+                subs_by_movie[movie_id].append((sub_path, label))
+        return subs_by_movie
 
     def get_movie(self, movie_id: int) -> Optional[Movie]:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT * FROM movies WHERE id = ?", (movie_id,)
+                _SQL_GET_MOVIE, (movie_id,)
             ).fetchone()
             if not row:
                 return None
-            movie = Movie(
-                id=row["id"], title=row["title"],
-                movie_path=row["movie_path"], thumb_path=row["thumb_path"],
-                date_added=row["date_added"], last_position=row["last_position"],
-                duration=row["duration"]
-            )
             subs = conn.execute(
-                "SELECT sub_path, label FROM subtitles WHERE movie_id = ?",
+                _SQL_GET_MOVIE_SUBTITLES,
                 (movie_id,)
             ).fetchall()
-            movie.subtitle_paths = [(s["sub_path"], s["label"]) for s in subs]
-            return movie
-        finally:
-            conn.close()
+            return Movie(*row, subtitle_paths=[tuple(s) for s in subs])
 
     def update_playback_position(self, movie_id: int, position: float):
-        conn = self._get_conn()
-        try:
-            conn.execute(
-                "UPDATE movies SET last_position = ? WHERE id = ?",
-                (position, movie_id)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._buffer_write(_SQL_UPDATE_MOVIE_POSITION, movie_id, position)
 
     def update_duration(self, movie_id: int, duration: float):
-        conn = self._get_conn()
-        try:
-            conn.execute(
-                "UPDATE movies SET duration = ? WHERE id = ?",
-                (duration, movie_id)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._buffer_write(_SQL_UPDATE_MOVIE_DURATION, movie_id, duration)
 
     def delete_movie(self, movie_id: int) -> Optional[Movie]:
-        movie = self.get_movie(movie_id)
-        if not movie:
-            return None
-        conn = self._get_conn()
-        try:
-            conn.execute("DELETE FROM movies WHERE id = ?", (movie_id,))
+        """Delete a movie and return its row (without subtitles), or None."""
+        with self._connection() as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(_SQL_DELETE_MOVIE_RETURNING, (movie_id,)).fetchone()
+            else:
+                row = conn.execute(_SQL_GET_MOVIE, (movie_id,)).fetchone()
+                if row:
+                    conn.execute(_SQL_DELETE_MOVIE, (movie_id,))
             conn.commit()
-            return movie
-        finally:
-            conn.close()
+            if not row:
+                return None
+            return Movie(*row)
 
     def get_movie_count(self) -> int:
-        conn = self._get_conn()
-        try:
-            row = conn.execute("SELECT COUNT(*) as cnt FROM movies").fetchone()
-            return row["cnt"]
-        finally:
-            conn.close()
+        with self._connection() as conn:
+            row = conn.execute(_SQL_COUNT_MOVIES).fetchone()
+            return row[0]
 
     # ---- Shows --------------------------------------------------------------------------------------------
 
     def add_show(self, title: str, thumb_path: str) -> int:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
-                "INSERT INTO shows (title, thumb_path) VALUES (?, ?)",
+                _SQL_INSERT_SHOW,
                 (title, thumb_path)
             )
             conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def add_season(self, show_id: int, season_number: int) -> int:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
-                "INSERT INTO seasons (show_id, season_number) VALUES (?, ?)",
+                _SQL_INSERT_SEASON,
                 (show_id, season_number)
             )
             conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_or_create_season(self, show_id: int, season_number: int) -> int:
         """Return existing season ID or create a new one."""
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT id FROM seasons WHERE show_id = ? AND season_number = ?",
+                _SQL_FIND_SEASON,
                 (show_id, season_number)
             ).fetchone()
             if row:
-                return row["id"]
+                return row[0]
             cursor = conn.execute(
-                "INSERT INTO seasons (show_id, season_number) VALUES (?, ?)",
+                _SQL_INSERT_SEASON,
                 (show_id, season_number)
             )
             conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
 
     def get_season_episode_count(self, season_id: int) -> int:
         """Return how many episodes exist in a season."""
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT COUNT(*) as cnt FROM episodes WHERE season_id = ?",
+                _SQL_COUNT_SEASON_EPISODES,
                 (season_id,)
             ).fetchone()
-            return row["cnt"]
-        finally:
-            conn.close()
+            return row[0]
 
     def add_episode(self, season_id: int, episode_number: int,
                     title: str, movie_path: str) -> int:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             cursor = conn.execute(
-                """INSERT INTO episodes (season_id, episode_number, title, movie_path)
-                   VALUES (?, ?, ?, ?)""",
+                _SQL_INSERT_EPISODE,
                 (season_id, episode_number, title, movie_path)
             )
             conn.commit()
             return cursor.lastrowid
-        finally:
-            conn.close()
-
-    def get_all_shows(self, sort_by: str = "date_added", ascending: bool = False) -> list:
-        order = "ASC" if ascending else "DESC"
-        if sort_by == "title":
-            order_clause = f"LOWER(title) {order}"
-        else:
-            order_clause = f"date_added {order}"
 
-        conn = self._get_conn()
-        try:
-            rows = conn.execute(
-                f"SELECT * FROM shows ORDER BY {order_clause}"
-            ).fetchall()
-            shows = []
-            for row in rows:
-                show = Show(
-                    id=row["id"], title=row["title"],
-                    thumb_path=row["thumb_path"], date_added=row["date_added"]
-                )
-                show.seasons = self._get_seasons(conn, show.id)
-                shows.append(show)
-            return shows
-        finally:
-            conn.close()
-
-    def search_shows(self, query: str, sort_by: str = "date_added", ascending: bool = False) -> list:
-        order = "ASC" if ascending else "DESC"
-        if sort_by == "title":
-            order_clause = f"LOWER(title) {order}"
-        else:
-            order_clause = f"date_added {order}"
-
-        conn = self._get_conn()
-        try:
+    def add_episodes(self, season_id: int, episodes: list) -> list:
+        """Insert (episode_number, title, movie_path) tuples in one transaction.
+        Returns the new episode IDs in insertion order."""
+        if not episodes:
+            return []
+        with self._connection() as conn:
+            conn.executemany(
+                _SQL_INSERT_EPISODE,
+                [(season_id, *ep) for ep in episodes]
+            )
+            conn.commit()
+            # executemany doesn't report lastrowid; AUTOINCREMENT ids are
+            # monotonic and we hold the lock, so the newest rows are ours.
             rows = conn.execute(
-                f"SELECT * FROM shows WHERE title LIKE ? ORDER BY {order_clause}",
-                (f"%{query}%",)
+                _SQL_LATEST_EPISODE_IDS,
+                (season_id, len(episodes))
             ).fetchall()
-            shows = []
-            for row in rows:
-                show = Show(
-                    id=row["id"], title=row["title"],
-                    thumb_path=row["thumb_path"], date_added=row["date_added"]
-                )
-                show.seasons = self._get_seasons(conn, show.id)
-                shows.append(show)
-            return shows
-        finally:
-            conn.close()
+            return [r[0] for r in reversed(rows)]
+
+    def get_all_shows(self, sort_by: str = "date_added", ascending: bool = False,
+                      with_seasons: bool = True) -> list:
+        sql = _SQL_LIST_SHOWS[_order_key(sort_by, ascending)]
+        with self._connection() as conn:
+            rows = conn.execute(sql).fetchall()
+            return self._build_shows(conn, rows, with_seasons)
+
+    def search_shows(self, query: str, sort_by: str = "date_added", ascending: bool = False,
+                     with_seasons: bool = True) -> list:
+        use_fts, params = self._title_filter(query)
+        sql = _SQL_SEARCH_SHOWS[(use_fts, _order_key(sort_by, ascending))]
+        with self._connection() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            return self._build_shows(conn, rows, with_seasons)
 
     def get_show(self, show_id: int) -> Optional[Show]:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT * FROM shows WHERE id = ?", (show_id,)
+                _SQL_GET_SHOW, (show_id,)
             ).fetchone()
             if not row:
                 return None
-            show = Show(
-                id=row["id"], title=row["title"],
-                thumb_path=row["thumb_path"], date_added=row["date_added"]
-            )
-            show.seasons = self._get_seasons(conn, show.id)
-            return show
-        finally:
-            conn.close()
-
-    def _get_seasons(self, conn, show_id: int) -> List[Season]:
-        rows = conn.execute(
-            "SELECT * FROM seasons WHERE show_id = ? ORDER BY season_number ASC",
-            (show_id,)
-        ).fetchall()
-        seasons = []
+            return self._build_shows(conn, [row])[0]
+
+    def _build_shows(self, conn, rows, with_seasons: bool = True) -> List[Show]:
+        """Build Show objects for rows. With with_seasons=False only the
+        season/episode counts are filled in, which is all the grid needs."""
+        show_ids = [row[0] for row in rows]
+        if not with_seasons:
+            counts = self._get_show_counts(conn, show_ids)
+            return [Show(*row, season_count=counts.get(row[0], (0, 0))[0],
+                         episode_count=counts.get(row[0], (0, 0))[1])
+                    for row in rows]
+
+        seasons_by_show = self._get_seasons_bulk(conn, show_ids)
+        shows = []
         for row in rows:
-            season = Season(
-                id=row["id"], show_id=row["show_id"],
-                season_number=row["season_number"], date_added=row["date_added"]
-            )
+            seasons = seasons_by_show.get(row[0], [])
+            shows.append(Show(*row, seasons=seasons, season_count=len(seasons),
+                              episode_count=sum(len(s.episodes) for s in seasons)))
+        return shows
+
+    def _get_show_counts(self, conn, show_ids: list) -> dict:
+        """Return {show_id: (season_count, episode_count)}."""
+        counts = {}
+        for chunk in _chunks(show_ids):
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT s.show_id, COUNT(DISTINCT s.id), COUNT(e.id) FROM seasons s "
+                f"LEFT JOIN episodes e ON e.season_id = s.id "
+                f"WHERE s.show_id IN ({placeholders}) GROUP BY s.show_id",
+                chunk
+            ).fetchall()
+            for show_id, season_count, episode_count in rows:
+                counts[show_id] = (season_count, episode_count)
+        return counts
+
+    def _get_seasons_bulk(self, conn, show_ids: list) -> dict:
+        """Return {show_id: [Season, ...]} with episodes attached.
+        Issues one seasons query and one episodes query per chunk of ids."""
+        seasons_by_show = defaultdict(list)
+        seasons_by_id = {}
+        for chunk in _chunks(show_ids):
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT {_SEASON_COLUMNS} FROM seasons WHERE show_id IN ({placeholders}) "
+                f"ORDER BY season_number ASC",
+                chunk
+            ).fetchall()
+            for row in rows:
+                season = Season(*row)
+                seasons_by_show[season.show_id].append(season)
+                seasons_by_id[season.id] = season
+
+        for chunk in _chunks(list(seasons_by_id)):
+            placeholders = ",".join("?" * len(chunk))
             eps = conn.execute(
-                "SELECT * FROM episodes WHERE season_id = ? ORDER BY episode_number ASC",
-                (row["id"],)
+                f"SELECT {_EPISODE_COLUMNS} FROM episodes WHERE season_id IN ({placeholders}) "
+                f"ORDER BY episode_number ASC",
+                chunk
             ).fetchall()
-            season.episodes = [
-                Episode(
-                    id=e["id"], season_id=e["season_id"],
-                    episode_number=e["episode_number"], title=e["title"],
-                    movie_path=e["movie_path"], last_position=e["last_position"],
-                    duration=e["duration"], date_added=e["date_added"]
-                ) for e in eps
-            ]
-            seasons.append(season)
-        return seasons
+            for e in eps:
+                episode = Episode(*e)
+                seasons_by_id[episode.season_id].episodes.append(episode)
+        return seasons_by_show
 
     def get_show_count(self) -> int:
-        conn = self._get_conn()
-        try:
-            row = conn.execute("SELECT COUNT(*) as cnt FROM shows").fetchone()
-            return row["cnt"]
-        finally:
-            conn.close()
+        with self._connection() as conn:
+            row = conn.execute(_SQL_COUNT_SHOWS).fetchone()
+            return row[0]
+
+    def get_library_stats(self) -> Tuple[int, int, int, int]:
+        """Return (movies, shows, seasons, episodes) counts in one query."""
+        with self._connection() as conn:
+            return tuple(conn.execute(_SQL_LIBRARY_STATS).fetchone())
 
     def get_existing_show_titles(self) -> list:
         """Return list of (id, title) for all existing shows."""
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             rows = conn.execute(
-                "SELECT id, title FROM shows ORDER BY LOWER(title) ASC"
+                _SQL_SHOW_TITLES
             ).fetchall()
-            return [(r["id"], r["title"]) for r in rows]
-        finally:
-            conn.close()
+            return [tuple(r) for r in rows]
 
     def get_next_season_number(self, show_id: int) -> int:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT MAX(season_number) as mx FROM seasons WHERE show_id = ?",
+                _SQL_MAX_SEASON,
                 (show_id,)
             ).fetchone()
-            return (row["mx"] or 0) + 1
-        finally:
-            conn.close()
+            return (row[0] or 0) + 1
 
     def update_episode_position(self, episode_id: int, position: float):
-        conn = self._get_conn()
-        try:
-            conn.execute(
-                "UPDATE episodes SET last_position = ? WHERE id = ?",
-                (position, episode_id)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._buffer_write(_SQL_UPDATE_EPISODE_POSITION, episode_id, position)
 
     def update_episode_duration(self, episode_id: int, duration: float):
-        conn = self._get_conn()
-        try:
-            conn.execute(
-                "UPDATE episodes SET duration = ? WHERE id = ?",
-                (duration, episode_id)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        self._buffer_write(_SQL_UPDATE_EPISODE_DURATION, episode_id, duration)
 
     def delete_show(self, show_id: int) -> Optional[Show]:
-        show = self.get_show(show_id)
-        if not show:
-            return None
-        conn = self._get_conn()
-        try:
-            conn.execute("DELETE FROM shows WHERE id = ?", (show_id,))
+        """Delete a show and return its row (without seasons), or None."""
+        with self._connection() as conn:
+            if _HAS_RETURNING:
+                row = conn.execute(_SQL_DELETE_SHOW_RETURNING, (show_id,)).fetchone()
+            else:
+                row = conn.execute(_SQL_GET_SHOW, (show_id,)).fetchone()
+                if row:
+                    conn.execute(_SQL_DELETE_SHOW, (show_id,))
             conn.commit()
-            return show
-        finally:
-            conn.close()
+            if not row:
+                return None
+            return Show(*row)
 
     # ---- Rename -------------------------------------------------------------------------------------------
 
     def rename_movie(self, movie_id: int, new_title: str):
-        conn = self._get_conn()
-        try:
-            conn.execute("UPDATE movies SET title = ? WHERE id = ?", (new_title, movie_id))
+        with self._connection() as conn:
+            conn.execute(_SQL_RENAME_MOVIE, (new_title, movie_id))
             conn.commit()
-        finally:
-            conn.close()
 
     def rename_show(self, show_id: int, new_title: str):
-        conn = self._get_conn()
-        try:
-            conn.execute("UPDATE shows SET title = ? WHERE id = ?", (new_title, show_id))
+        with self._connection() as conn:
+            conn.execute(_SQL_RENAME_SHOW, (new_title, show_id))
+            conn.commit()
+
+    # ---- Posters -----------------------------------------------------------------------------------------
+
+    def get_thumb_paths(self) -> list:
+        """Return list of (kind, id, thumb_path) for every movie and show."""
+        with self._connection() as conn:
+            movies = conn.execute(_SQL_MOVIE_THUMBS).fetchall()
+            shows = conn.execute(_SQL_SHOW_THUMBS).fetchall()
+            return ([("movie", mid, thumb) for mid, thumb in movies] +
+                    [("show", sid, thumb) for sid, thumb in shows])
+
+    def update_movie_thumb(self, movie_id: int, thumb_path: str):
+        with self._connection() as conn:
+            conn.execute(_SQL_UPDATE_MOVIE_THUMB, (thumb_path, movie_id))
+            conn.commit()
+
+    def update_show_thumb(self, show_id: int, thumb_path: str):
+        with self._connection() as conn:
+            conn.execute(_SQL_UPDATE_SHOW_THUMB, (thumb_path, show_id))
             conn.commit()
-        finally:
-            conn.close()
 
     # ---- Continue Watching --------------------------------------------------------------------------------
 
     def get_continue_watching(self, limit: int = 20) -> list:
         """Return list of (type, item) for movies/episodes with progress.
         Returns dicts with type='movie' or type='episode' plus show info."""
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             results = []
             # Movies in progress
             movie_rows = conn.execute(
-                """SELECT * FROM movies
-                   WHERE last_position > 0 AND duration > 0
-                     AND (last_position / duration) < 0.95
-                   ORDER BY date_added DESC"""
+                _SQL_MOVIES_IN_PROGRESS
             ).fetchall()
-            for row in movie_rows:
-                movie = Movie(
-                    id=row["id"], title=row["title"],
-                    movie_path=row["movie_path"], thumb_path=row["thumb_path"],
-                    date_added=row["date_added"], last_position=row["last_position"],
-                    duration=row["duration"]
-                )
-                subs = conn.execute(
-                    "SELECT sub_path, label FROM subtitles WHERE movie_id = ?",
-                    (row["id"],)
-                ).fetchall()
-                movie.subtitle_paths = [(s["sub_path"], s["label"]) for s in subs]
+            for movie in self._build_movies(conn, movie_rows):
                 results.append({"type": "movie", "item": movie})
 
             # Episodes in progress
             ep_rows = conn.execute(
-                """SELECT e.*, s.show_id, s.season_number, sh.title as show_title,
-                          sh.thumb_path as show_thumb
-                   FROM episodes e
-                   JOIN seasons s ON e.season_id = s.id
-                   JOIN shows sh ON s.show_id = sh.id
-                   WHERE e.last_position > 0 AND e.duration > 0
-                     AND (e.last_position / e.duration) < 0.95
-                   ORDER BY e.date_added DESC"""
+                _SQL_EPISODES_IN_PROGRESS
             ).fetchall()
             for row in ep_rows:
-                ep = Episode(
-                    id=row["id"], season_id=row["season_id"],
-                    episode_number=row["episode_number"], title=row["title"],
-                    movie_path=row["movie_path"], last_position=row["last_position"],
-                    duration=row["duration"], date_added=row["date_added"]
-                )
+                show_id, season_number, show_title, show_thumb = row[8:]
                 results.append({
-                    "type": "episode", "item": ep,
-                    "show_title": row["show_title"],
-                    "show_id": row["show_id"],
-                    "show_thumb": row["show_thumb"],
-                    "season_number": row["season_number"]
+                    "type": "episode", "item": Episode(*row[:8]),
+                    "show_title": show_title,
+                    "show_id": show_id,
+                    "show_thumb": show_thumb,
+                    "season_number": season_number
                 })
 
             return results[:limit]
-        finally:
-            conn.close()
 
     # ---- Settings -----------------------------------------------------------------------------------------
 
     def get_setting(self, key: str, default: str = "") -> str:
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             row = conn.execute(
-                "SELECT value FROM settings WHERE key = ?", (key,)
+                _SQL_GET_SETTING, (key,)
             ).fetchone()
-            return row["value"] if row else default
-        finally:
-            conn.close()
+            return row[0] if row else default
 
     def set_setting(self, key: str, value: str):
-        conn = self._get_conn()
-        try:
+        with self._connection() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                _SQL_SET_SETTING,
                 (key, value)
             )
             conn.commit()
-        finally:
-            conn.close()
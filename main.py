@@ -16,7 +16,8 @@ if app_dir not in sys.path:
     sys.path.insert(0, app_dir)
 
 # --- VLC setup for bundled builds ---
-# Must happen BEFORE importing vlc module
+# Must happen BEFORE importing vlc module. libvlc itself is loaded lazily by
+# utils.vlc_loader the first time something is played.
 if getattr(sys, 'frozen', False):
     vlc_dir = os.path.join(app_dir, "vlc")
     if sys.platform == "win32":
@@ -30,16 +31,6 @@ if getattr(sys, 'frozen', False):
     elif sys.platform == "darwin":
         if os.path.isdir(vlc_dir):
             os.environ["VLC_PLUGIN_PATH"] = os.path.join(vlc_dir, "plugins")
-            # Preload libvlc via ctypes so python-vlc finds it
-            # (DYLD_LIBRARY_PATH doesn't work when set from within the process)
-            import ctypes
-            for lib_name in ["libvlccore.dylib", "libvlc.dylib"]:
-                lib_path = os.path.join(vlc_dir, lib_name)
-                if os.path.isfile(lib_path):
-                    try:
-                        ctypes.cdll.LoadLibrary(lib_path)
-                    except OSError:
-                        pass
             # Also set for any subprocess spawning
             os.environ["DYLD_LIBRARY_PATH"] = vlc_dir + os.pathsep + os.environ.get("DYLD_LIBRARY_PATH", "")
 
@@ -52,9 +43,41 @@ if sys.platform == "win32":
         pass
 
 
+# Kept at module level so the window outlives _finish_boot()
+_main_window = None
+
+
+def _make_splash():
+    """Build a plain splash screen without loading any image from disk."""
+    from PySide6.QtWidgets import QSplashScreen
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QPixmap, QPainter, QColor, QFont
+
+    pixmap = QPixmap(360, 200)
+    pixmap.fill(QColor("#FCE4EC"))
+    painter = QPainter(pixmap)
+    font = QFont()
+    font.setPointSize(28)
+    font.setBold(True)
+    painter.setFont(font)
+    painter.setPen(QColor("#D81B60"))
+    painter.drawText(pixmap.rect(), Qt.AlignCenter, "BebeFlix")
+    painter.end()
+    return QSplashScreen(pixmap)
+
+
+def _finish_boot(splash):
+    global _main_window
+    # Deferred so the splash paints before the UI, database and vlc imports
+    from ui.main_window import MainWindow
+    _main_window = MainWindow()
+    _main_window.show()
+    splash.finish(_main_window)
+
+
 def main():
     from PySide6.QtWidgets import QApplication
-    from PySide6.QtCore import Qt
+    from PySide6.QtCore import Qt, QTimer
 
     QApplication.setHighDpiScaleFactorRoundingPolicy(
         Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
@@ -64,12 +87,11 @@ def main():
     app.setApplicationName("BebeFlix")
     app.setOrganizationName("BebeFlix")
 
-    from ui.styles import LIGHT_THEME
-    app.setStyleSheet(LIGHT_THEME)
+    splash = _make_splash()
+    splash.show()
+    app.processEvents()
 
-    from ui.main_window import MainWindow
-    window = MainWindow()
-    window.show()
+    QTimer.singleShot(0, lambda: _finish_boot(splash))
 
     sys.exit(app.exec())
 
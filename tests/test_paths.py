@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+
+from utils.paths import remove_replaced_file
+
+
+def _case_insensitive(directory: str) -> bool:
+    probe = os.path.join(directory, "case_probe")
+    open(probe, "w").close()
+    try:
+        return os.path.exists(probe.upper())
+    finally:
+        os.remove(probe)
+
+
+class RemoveReplacedFileTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str) -> str:
+        path = os.path.join(self.dir, name)
+        with open(path, "wb") as f:
+            f.write(b"poster")
+        return path
+
+    def test_removes_superseded_original(self):
+        src = self._write("thumbnail.png")
+        dest = self._write("thumbnail.jpg")
+        remove_replaced_file(src, dest)
+        self.assertFalse(os.path.exists(src))
+        self.assertTrue(os.path.exists(dest))
+
+    def test_keeps_file_reached_under_another_name(self):
+        # A hard link stands in for .JPG/.jpg naming one file on a
+        # case-insensitive drive
+        dest = self._write("thumbnail.jpg")
+        src = os.path.join(self.dir, "thumbnail.JPG")
+        os.link(dest, src)
+        remove_replaced_file(src, dest)
+        self.assertTrue(os.path.exists(dest))
+
+    def test_keeps_upper_case_jpg_on_case_insensitive_drive(self):
+        if not _case_insensitive(self.dir):
+            self.skipTest("filesystem is case-sensitive")
+        src = self._write("thumbnail.JPG")
+        dest = os.path.join(self.dir, "thumbnail.jpg")
+        remove_replaced_file(src, dest)
+        self.assertTrue(os.path.exists(dest))
+
+    def test_missing_original_is_ignored(self):
+        dest = self._write("thumbnail.jpg")
+        remove_replaced_file(os.path.join(self.dir, "gone.png"), dest)
+        self.assertTrue(os.path.exists(dest))
+
+
+if __name__ == "__main__":
+    unittest.main()
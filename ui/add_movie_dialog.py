@@ -4,20 +4,96 @@ Toggle between movie mode and show mode.
 """
 
 import os
+import queue
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                                 QLineEdit, QPushButton, QComboBox, QFileDialog,
                                 QProgressBar, QCheckBox, QMessageBox, QGroupBox,
                                 QSizePolicy, QSpinBox, QListWidget, QListWidgetItem,
                                 QRadioButton, QButtonGroup, QWidget)
-from PySide6.QtCore import Qt, Signal, Slot, QTimer
+from PySide6.QtCore import Qt, Signal, Slot, QTimer, QThread
 
 from database import Database
-from utils.paths import (get_movies_dir, get_library_root, slugify,
-                         make_movie_dir, get_drive_free_space, format_file_size)
+from utils.paths import (get_library_root, slugify,
+                         make_movie_dir, get_drive_free_space, format_file_size,
+                         stage_file)
 from utils.compression import (PRESETS, PRESET_ORDER, CompressionThread,
-                                get_embedded_subtitles, _detect_gpu_encoder)
+                                SubtitleProbeThread, EncoderQueueThread,
+                               _detect_gpu_encoder)
+from utils.thumbnails import make_poster_thumbnail
+from ui.styles import LIGHT_DIALOG, DARK_DIALOG
+
+# Episodes processed at once. x264 already spreads one encode across every
+# core, so a second job mostly overlaps one file's probing and disk I/O with
+# another's encode; more would just thrash the drive.
+MAX_PARALLEL_EPISODES = 2
+
+# Subtitle files are tiny, so copying them is all open/close round-trips;
+# a few at once hides that latency on slow drives.
+MAX_SUBTITLE_COPIES = 4
+
+_NAT_RE = re.compile(r'(\d+)')
+_SXXEXX_RE = re.compile(r'[Ss]\d+[Ee]\d+')
+_NXN_RE = re.compile(r'\d+[xX]\d+')
+_BRACKET_RE = re.compile(r'[\[\(].*?[\]\)]')
+_WS_RE = re.compile(r'\s+')
+_CLEAN_NAME_RE = re.compile(r'[._-]')
+
+
+class _MovieStagingThread(QThread):
+    """Writes a movie's poster thumbnail and copies its subtitle files into
+    the library so large images never stall the dialog."""
+    finished_signal = Signal(str, list, str)  # rel_thumb, subtitle entries, error
+
+    def __init__(self, thumb_path, subtitle_paths, movie_dir, root, parent=None):
+        super().__init__(parent)
+        self.thumb_path = thumb_path
+        self.subtitle_paths = subtitle_paths
+        self.movie_dir = movie_dir
+        self.root = root
+
+    def run(self):
+        try:
+            thumb_dest = make_poster_thumbnail(self.thumb_path, self.movie_dir, "thumbnail")
+            rel_thumb = os.path.relpath(thumb_dest, self.root)
+        except Exception as e:
+            self.finished_signal.emit("", [], f"Failed to copy thumbnail: {e}")
+            return
+
+        rel_dir = os.path.relpath(self.movie_dir, self.root)
+        jobs = [(sub_path, f"subtitle_{i}{os.path.splitext(sub_path)[1]}")
+                for i, sub_path in enumerate(self.subtitle_paths)]
+        with ThreadPoolExecutor(max_workers=MAX_SUBTITLE_COPIES) as pool:
+            copied = list(pool.map(self._copy_subtitle, jobs))
+
+        subtitle_entries = [{
+            "sub_path": os.path.join(rel_dir, sub_name),
+            "label": os.path.splitext(os.path.basename(sub_path))[0],
+            "is_embedded": False, "track_index": 0
+        } for (sub_path, sub_name), ok in zip(jobs, copied) if ok]
+        self.finished_signal.emit(rel_thumb, subtitle_entries, "")
+
+    def _copy_subtitle(self, job) -> bool:
+        sub_path, sub_name = job
+        try:
+            stage_file(sub_path, os.path.join(self.movie_dir, sub_name))
+            return True
+        except Exception:
+            return False
+
+
+class _ShowTitlesThread(QThread):
+    """Loads (id, title) pairs for the show selector while the dialog opens."""
+    finished_signal = Signal(list)
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+
+    def run(self):
+        self.finished_signal.emit(self.db.get_existing_show_titles())
 
 
 class AddMovieDialog(QDialog):
@@ -27,27 +103,50 @@ class AddMovieDialog(QDialog):
     VIDEO_EXTENSIONS = "Video Files (*.mp4 *.mkv *.avi *.mov *.webm *.wmv *.m4v *.flv);;All Files (*)"
     IMAGE_EXTENSIONS = "Image Files (*.jpg *.jpeg *.png *.webp *.bmp);;All Files (*)"
     SUBTITLE_EXTENSIONS = "Subtitle Files (*.srt *.ass *.ssa *.sub *.vtt);;All Files (*)"
+    SPACE_POLL_MS = 5000
+    CANCEL_TIMEOUT_MS = 5000
+
+    # (path, mtime_ns, size) -> embedded subtitle tracks, shared by all dialogs
+    _probe_cache = {}
+    PROGRESS_REFRESH_MS = 100
 
     def __init__(self, db: Database, parent=None, mode="movie",
                  existing_show=None, season_number=None):
         super().__init__(parent)
         self.db = db
         self._movie_path = ""
+        self._movie_stat = None  # os.stat of _movie_path, taken once on selection
         self._thumb_path = ""
         self._subtitle_paths = []
         self._embedded_subs = []
+        self._probe_thread = None
         self._episode_paths = []
+        self._episode_path_set = set()
         self._compression_thread = None
+        self._staging_thread = None
+        self._cancelling = []       # workers still shutting down after a cancel
+        self._cancel_generation = 0
         self._is_processing = False
         self._mode = mode
         self._existing_show = existing_show
         self._forced_season = season_number
         self._episode_queue = []
-        self._current_ep_index = 0
+        self._completed_episodes = []
+        self._episodes_done = 0
+        self._episode_failures = []  # (queue index, message), reported at the end
+        self._encoders = []
+        self._episode_progress = {}  # queue index -> percent
+        self._pending_data = {}
+        self._latest_progress = None  # (bar value, status text) not yet painted
+
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(self.PROGRESS_REFRESH_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         self.setWindowTitle("Add Content - BebeFlix")
         self.setMinimumWidth(560)
         self.setMinimumHeight(580)
+        self._apply_theme()
         self._setup_ui()
 
         # If adding season to existing show, lock to show mode
@@ -56,6 +155,55 @@ class AddMovieDialog(QDialog):
             self._on_mode_changed()
             self.movie_radio.setEnabled(False)
 
+    def _apply_theme(self):
+        dark = self.db.get_setting("dark_mode", "0") == "1"
+        self.setStyleSheet(DARK_DIALOG if dark else LIGHT_DIALOG)
+
+    def reset(self):
+        """Clear the form so the dialog can be reopened for another import.
+        An import still running is left as is, so reopening shows its progress."""
+        if self._is_processing and self._import_running():
+            return
+        self._movie_path = ""
+        self._movie_stat = None
+        self._thumb_path = ""
+        self._subtitle_paths = []
+        self._embedded_subs = []
+        self._probe_thread = None
+        self._pending_data = {}
+        self._completed_episodes = []
+        self._clear_episodes()
+
+        self.title_input.clear()
+        self.movie_path_label.setText("No file selected")
+        self.thumb_path_label.setText("No file selected")
+        self.sub_path_label.setText("No subtitle files selected")
+        self.sub_path_label.setToolTip("")
+        self.embedded_info.setText("")
+        self.show_title_input.clear()
+        self.show_thumb_label.setText("No file selected")
+        self.season_spin.setValue(1)
+        self.show_selector.setCurrentIndex(0)
+        self.movie_radio.setChecked(True)
+        self._reset_ui()
+
+        self._apply_theme()
+        self._update_space_label()
+        self._space_timer.start()
+        # Shows may have been added since the dialog was last open
+        self._load_show_titles()
+
+    def _import_running(self) -> bool:
+        workers = [self._staging_thread, self._compression_thread,
+                   *self._encoders, *self._cancelling]
+        if self._pending_data.get("awaiting_probe"):
+            workers.append(self._probe_thread)
+        return any(w is not None and w.isRunning() for w in workers)
+
+    def done(self, result):
+        self._space_timer.stop()
+        super().done(result)
+
     def _setup_ui(self):
         outer = QVBoxLayout(self)
         outer.setSpacing(0)
@@ -158,17 +306,13 @@ class AddMovieDialog(QDialog):
         show_layout.addWidget(QLabel("Show:"))
         self.show_selector = QComboBox()
         self.show_selector.addItem("-- New Show --", None)
-        for sid, stitle in self.db.get_existing_show_titles():
-            self.show_selector.addItem(stitle, sid)
+        # Pre-select existing show if provided; the rest load in the background
+        if self._existing_show:
+            self.show_selector.addItem(self._existing_show.title, self._existing_show.id)
+            self.show_selector.setCurrentIndex(1)
         self.show_selector.currentIndexChanged.connect(self._on_show_selected)
         show_layout.addWidget(self.show_selector)
-
-        # Pre-select existing show if provided
-        if self._existing_show:
-            for i in range(self.show_selector.count()):
-                if self.show_selector.itemData(i) == self._existing_show.id:
-                    self.show_selector.setCurrentIndex(i)
-                    break
+        self._load_show_titles()
 
         # New show fields
         self.new_show_group = QWidget()
@@ -278,6 +422,11 @@ class AddMovieDialog(QDialog):
         self.space_label.setObjectName("subtitleLabel")
         self._update_space_label()
         layout.addWidget(self.space_label)
+        # Poll instead of re-querying on every browse
+        self._space_timer = QTimer(self)
+        self._space_timer.setInterval(self.SPACE_POLL_MS)
+        self._space_timer.timeout.connect(self._update_space_label)
+        self._space_timer.start()
 
         self.progress_bar = QProgressBar()
         self.progress_bar.setRange(0, 100)
@@ -342,65 +491,159 @@ class AddMovieDialog(QDialog):
             next_season = self.db.get_next_season_number(show_id)
             self.season_spin.setValue(next_season)
 
+    def _load_show_titles(self):
+        self._titles_thread = _ShowTitlesThread(self.db, parent=self)
+        self._titles_thread.finished_signal.connect(self._on_show_titles_loaded)
+        self._titles_thread.start()
+
+    @Slot(list)
+    def _on_show_titles_loaded(self, rows):
+        # Refill in one pass, keeping whatever is selected
+        selected_id = self.show_selector.currentData()
+        self.show_selector.blockSignals(True)
+        self.show_selector.clear()
+        self.show_selector.addItem("-- New Show --", None)
+        for sid, stitle in rows:
+            self.show_selector.addItem(stitle, sid)
+        index = self.show_selector.findData(selected_id) if selected_id is not None else 0
+        self.show_selector.setCurrentIndex(max(index, 0))
+        self.show_selector.blockSignals(False)
+        if index < 0:
+            self._on_show_selected()
+
     # ---- Browse handlers ------------------------------------------------------------------------
 
+    def _open_file_dialog(self, caption, name_filter, on_selected, multiple=False):
+        """Show a window-modal file picker without blocking in a nested event
+        loop; on_selected gets a path, or a list of paths when multiple."""
+        dlg = QFileDialog(self, caption, "", name_filter)
+        dlg.setAttribute(Qt.WA_DeleteOnClose)
+        # Skip per-entry icon lookups and symlink resolution, which stall
+        # on large folders over network mounts
+        dlg.setOptions(QFileDialog.DontUseCustomDirectoryIcons
+                       | QFileDialog.DontResolveSymlinks)
+        if multiple:
+            dlg.setFileMode(QFileDialog.ExistingFiles)
+            dlg.filesSelected.connect(on_selected)
+        else:
+            dlg.setFileMode(QFileDialog.ExistingFile)
+            dlg.fileSelected.connect(on_selected)
+        dlg.open()
+
     def _browse_movie(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Movie File", "", self.VIDEO_EXTENSIONS)
+        self._open_file_dialog("Select Movie File", self.VIDEO_EXTENSIONS,
+                               self._on_movie_selected)
+
+    def _on_movie_selected(self, path):
         if path:
+            try:
+                self._movie_stat = os.stat(path)
+            except OSError:
+                QMessageBox.warning(self, "Missing Movie", "Please select a valid movie file.")
+                return
             self._movie_path = path
             filename = os.path.basename(path)
-            size = format_file_size(os.path.getsize(path))
+            size = format_file_size(self._movie_stat.st_size)
             self.movie_path_label.setText(f"{filename} ({size})")
             if not self.title_input.text().strip():
                 name_no_ext = os.path.splitext(filename)[0]
-                clean = name_no_ext.replace(".", " ").replace("_", " ").replace("-", " ")
+                clean = _CLEAN_NAME_RE.sub(" ", name_no_ext)
                 self.title_input.setText(clean.strip())
             if self.embedded_check.isChecked():
                 self._detect_embedded_subs(path)
-            self._update_space_label()
 
     def _browse_thumbnail(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Thumbnail Image", "", self.IMAGE_EXTENSIONS)
+        self._open_file_dialog("Select Thumbnail Image", self.IMAGE_EXTENSIONS,
+                               self._on_thumbnail_selected)
+
+    def _on_thumbnail_selected(self, path):
         if path:
             self._thumb_path = path
             self.thumb_path_label.setText(os.path.basename(path))
 
     def _browse_show_thumbnail(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Show Poster", "", self.IMAGE_EXTENSIONS)
+        self._open_file_dialog("Select Show Poster", self.IMAGE_EXTENSIONS,
+                               self._on_show_thumbnail_selected)
+
+    def _on_show_thumbnail_selected(self, path):
         if path:
             self._thumb_path = path
             self.show_thumb_label.setText(os.path.basename(path))
 
     def _browse_subtitles(self):
-        paths, _ = QFileDialog.getOpenFileNames(self, "Select Subtitle Files", "", self.SUBTITLE_EXTENSIONS)
+        self._open_file_dialog("Select Subtitle Files", self.SUBTITLE_EXTENSIONS,
+                               self._on_subtitles_selected, multiple=True)
+
+    def _on_subtitles_selected(self, paths):
         if paths:
             self._subtitle_paths = paths
-            self.sub_path_label.setText(", ".join(os.path.basename(p) for p in paths))
+            names = [os.path.basename(p) for p in paths]
+            text = ", ".join(names[:3])
+            if len(names) > 3:
+                text = f"{len(names)} files: {text} (+{len(names) - 3} more)"
+            self.sub_path_label.setText(text)
+            self.sub_path_label.setToolTip("\n".join(names))
 
     def _browse_episodes(self):
-        paths, _ = QFileDialog.getOpenFileNames(self, "Select Episode Files", "", self.VIDEO_EXTENSIONS)
+        self._open_file_dialog("Select Episode Files", self.VIDEO_EXTENSIONS,
+                               self._on_episodes_selected, multiple=True)
+
+    def _on_episodes_selected(self, paths):
+        # Skip files already in the list
+        paths = [p for p in dict.fromkeys(paths) if p not in self._episode_path_set]
         if paths:
+            self._episode_path_set.update(paths)
             # Sort naturally by filename (Episode 1, 2, 3...)
             paths.sort(key=lambda p: self._natural_sort_key(os.path.basename(p)))
+            start = len(self._episode_paths)
             self._episode_paths.extend(paths)
-            self._refresh_episode_list()
+            self._append_episode_rows(start)
 
     def _clear_episodes(self):
         self._episode_paths.clear()
+        self._episode_path_set.clear()
         self.episode_list.clear()
 
-    def _refresh_episode_list(self):
-        self.episode_list.clear()
-        for i, path in enumerate(self._episode_paths):
-            name = os.path.basename(path)
-            self.episode_list.addItem(f"E{i+1}: {name}")
+    def _append_episode_rows(self, start):
+        """Add list rows for _episode_paths[start:]; earlier rows never change
+        since new batches are only ever appended."""
+        self.episode_list.addItems([
+            f"E{i + 1}: {os.path.basename(path)}"
+            for i, path in enumerate(self._episode_paths[start:], start)
+        ])
 
     @staticmethod
     def _natural_sort_key(s):
-        return [int(c) if c.isdigit() else c.lower() for c in re.split(r'(\d+)', s)]
+        return [int(c) if c.isdigit() else c.lower() for c in _NAT_RE.split(s)]
+
+    def _probe_key(self):
+        st = self._movie_stat
+        return (self._movie_path, st.st_mtime_ns, st.st_size)
 
     def _detect_embedded_subs(self, movie_path):
-        self._embedded_subs = get_embedded_subtitles(movie_path)
+        cached = self._probe_cache.get(self._probe_key())
+        if cached is not None:
+            self._probe_thread = None
+            self._show_embedded_subs(cached)
+            return
+        self._embedded_subs = []
+        self.embedded_info.setText("Probing embedded subtitles...")
+        self._probe_thread = SubtitleProbeThread(movie_path, parent=self)
+        self._probe_thread.finished_signal.connect(self._on_subs_probed)
+        self._probe_thread.start()
+
+    def _on_subs_probed(self, movie_path, subtitles):
+        # A newer browse may have replaced the file while this probe ran
+        if self.sender() is not self._probe_thread or movie_path != self._movie_path:
+            return
+        self._probe_thread = None
+        self._probe_cache[self._probe_key()] = subtitles
+        self._show_embedded_subs(subtitles)
+        if self._is_processing and self._pending_data.pop("awaiting_probe", False):
+            self._start_movie_compression()
+
+    def _show_embedded_subs(self, subtitles):
+        self._embedded_subs = subtitles
         if self._embedded_subs:
             labels = [s["label"] for s in self._embedded_subs]
             self.embedded_info.setText(f"Found {len(self._embedded_subs)} embedded track(s): {', '.join(labels)}")
@@ -420,10 +663,12 @@ class AddMovieDialog(QDialog):
         if not self.title_input.text().strip():
             QMessageBox.warning(self, "Missing Title", "Please enter a movie title.")
             return False
-        if not self._movie_path or not os.path.exists(self._movie_path):
+        # The pickers only return existing files and the selection was stat'ed
+        # then; a file removed since fails the import with its own error
+        if not self._movie_path or self._movie_stat is None:
             QMessageBox.warning(self, "Missing Movie", "Please select a valid movie file.")
             return False
-        if not self._thumb_path or not os.path.exists(self._thumb_path):
+        if not self._thumb_path:
             QMessageBox.warning(self, "Missing Thumbnail", "Please select a poster/thumbnail image.")
             return False
         return True
@@ -435,7 +680,7 @@ class AddMovieDialog(QDialog):
             if not self.show_title_input.text().strip():
                 QMessageBox.warning(self, "Missing Title", "Please enter a show name.")
                 return False
-            if not self._thumb_path or not os.path.exists(self._thumb_path):
+            if not self._thumb_path:
                 QMessageBox.warning(self, "Missing Poster", "Please select a poster image for the new show.")
                 return False
         if not self._episode_paths:
@@ -471,49 +716,62 @@ class AddMovieDialog(QDialog):
         preset_key = self.preset_combo.currentData()
         ext = os.path.splitext(self._movie_path)[1] if preset_key == "copy" else ".mp4"
 
+        root = get_library_root()
         movie_dest = os.path.join(movie_dir, f"movie{ext}")
-        rel_movie = os.path.relpath(movie_dest, get_library_root())
+        rel_movie = os.path.relpath(movie_dest, root)
 
-        thumb_ext = os.path.splitext(self._thumb_path)[1]
-        thumb_dest = os.path.join(movie_dir, f"thumbnail{thumb_ext}")
-        rel_thumb = os.path.relpath(thumb_dest, get_library_root())
-        try:
-            shutil.copy2(self._thumb_path, thumb_dest)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to copy thumbnail: {e}")
+        self.status_label.setText("Copying poster and subtitles...")
+        self._pending_data = {
+            "type": "movie",
+            "title": title, "rel_movie": rel_movie, "movie_dest": movie_dest,
+            "preset_key": preset_key, "movie_dir": movie_dir
+        }
+        self._staging_thread = _MovieStagingThread(
+            self._thumb_path, list(self._subtitle_paths), movie_dir, root, parent=self
+        )
+        self._staging_thread.finished_signal.connect(self._on_movie_staged)
+        self._staging_thread.start()
+
+    @Slot(str, list, str)
+    def _on_movie_staged(self, rel_thumb, subtitle_entries, error):
+        # Dropped by a cancel while staging
+        if self.sender() is not self._staging_thread:
+            return
+        self._staging_thread = None
+        if error:
+            QMessageBox.critical(self, "Error", error)
             self._reset_ui()
             return
 
-        subtitle_entries = []
-        for i, sub_path in enumerate(self._subtitle_paths):
-            sub_ext = os.path.splitext(sub_path)[1]
-            sub_dest = os.path.join(movie_dir, f"subtitle_{i}{sub_ext}")
-            try:
-                shutil.copy2(sub_path, sub_dest)
-                subtitle_entries.append({
-                    "sub_path": os.path.relpath(sub_dest, get_library_root()),
-                    "label": os.path.splitext(os.path.basename(sub_path))[0],
-                    "is_embedded": False, "track_index": 0
-                })
-            except Exception:
-                pass
+        data = self._pending_data
+        data["rel_thumb"] = rel_thumb
+        data["subtitle_entries"] = subtitle_entries
+        probe = self._probe_thread
+        cached = self._probe_cache.get(self._probe_key())
+        if cached is not None:
+            # This file version was probed before; no need to wait on a thread
+            self._embedded_subs = cached
+        elif (self.embedded_check.isChecked() and probe is not None
+                and probe.input_path == self._movie_path):
+            # Added before the probe reported back; _on_subs_probed resumes
+            data["awaiting_probe"] = True
+            self.status_label.setText("Probing embedded subtitles...")
+            return
+        self._start_movie_compression()
+
+    def _start_movie_compression(self):
+        data = self._pending_data
         if self.embedded_check.isChecked():
-            for emb in self._embedded_subs:
-                subtitle_entries.append(emb)
+            data["subtitle_entries"].extend(self._embedded_subs)
 
         self.status_label.setText("Processing movie file...")
-        self._pending_data = {
-            "type": "movie",
-            "title": title, "rel_movie": rel_movie, "rel_thumb": rel_thumb,
-            "subtitle_entries": subtitle_entries, "movie_dir": movie_dir
-        }
-
-        preset = PRESETS.get(preset_key)
+        preset = PRESETS.get(data["preset_key"])
         self._compression_thread = CompressionThread(
-            self._movie_path, movie_dest, preset, parent=self
+            self._movie_path, data["movie_dest"], preset, parent=self
         )
         self._compression_thread.progress.connect(self._update_progress)
         self._compression_thread.finished_signal.connect(self._on_single_complete)
+        self._progress_timer.start()
         self._compression_thread.start()
 
     def _start_show_add(self):
@@ -527,41 +785,40 @@ class AddMovieDialog(QDialog):
         show_id = self.show_selector.currentData()
         if show_id is None:
             show_title = self.show_title_input.text().strip()
-            show_slug = slugify(show_title)
-            show_dir = make_movie_dir(show_slug)
-            # Copy show thumbnail
-            thumb_ext = os.path.splitext(self._thumb_path)[1]
-            thumb_dest = os.path.join(show_dir, f"poster{thumb_ext}")
-            rel_thumb = os.path.relpath(thumb_dest, get_library_root())
+        else:
+            show_title = self.show_selector.currentText()
+        root = get_library_root()
+        show_dir = make_movie_dir(slugify(show_title))
+
+        if show_id is None:
+            # Store a downscaled copy of the show poster
             try:
-                shutil.copy2(self._thumb_path, thumb_dest)
+                thumb_dest = make_poster_thumbnail(self._thumb_path, show_dir, "poster")
+                rel_thumb = os.path.relpath(thumb_dest, root)
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to copy poster: {e}")
                 self._reset_ui()
                 return
             show_id = self.db.add_show(show_title, rel_thumb)
-        else:
-            show_title = self.show_selector.currentText()
 
         season_num = self.season_spin.value()
         season_id = self.db.get_or_create_season(show_id, season_num)
         existing_ep_count = self.db.get_season_episode_count(season_id)
-        show_slug = slugify(show_title)
 
         # Build episode queue
         preset_key = self.preset_combo.currentData()
         preset = PRESETS.get(preset_key)
+        rel_show_dir = os.path.relpath(show_dir, root)
         self._episode_queue = []
 
         for i, ep_path in enumerate(self._episode_paths):
             ep_num = existing_ep_count + i + 1
-            ep_slug = f"s{season_num:02d}e{ep_num:02d}"
-            ep_dir = os.path.join(get_movies_dir(), show_slug, ep_slug)
-            os.makedirs(ep_dir, exist_ok=True)
-
             ext = os.path.splitext(ep_path)[1] if preset_key == "copy" else ".mp4"
-            ep_dest = os.path.join(ep_dir, f"episode{ext}")
-            rel_ep = os.path.relpath(ep_dest, get_library_root())
+            # Paths are built under the show folder, so no per-episode relpath
+            rel_ep_dir = os.path.join(rel_show_dir, f"s{season_num:02d}e{ep_num:02d}")
+            os.makedirs(os.path.join(root, rel_ep_dir), exist_ok=True)
+            rel_ep = os.path.join(rel_ep_dir, f"episode{ext}")
+            ep_dest = os.path.join(root, rel_ep)
 
             # Try to extract episode title from filename
             ep_title = self._extract_episode_title(os.path.basename(ep_path))
@@ -574,8 +831,11 @@ class AddMovieDialog(QDialog):
             })
 
         self._pending_data = {"type": "show", "show_id": show_id}
-        self._current_ep_index = 0
-        self._process_next_episode()
+        self._completed_episodes = []
+        self._episodes_done = 0
+        self._episode_failures = []
+        self._episode_progress = {}
+        self._start_encoders(preset)
 
     @staticmethod
     def _extract_episode_title(filename):
@@ -583,76 +843,120 @@ class AddMovieDialog(QDialog):
         name = os.path.splitext(filename)[0]
         name = name.replace(".", " ").replace("_", " ")
         # Remove common patterns like S01E01, 1x01, etc.
-        name = re.sub(r'[Ss]\d+[Ee]\d+', '', name)
-        name = re.sub(r'\d+[xX]\d+', '', name)
-        name = re.sub(r'[\[\(].*?[\]\)]', '', name)
-        name = re.sub(r'\s+', ' ', name).strip(" -")
+        name = _SXXEXX_RE.sub('', name)
+        name = _NXN_RE.sub('', name)
+        name = _BRACKET_RE.sub('', name)
+        name = _WS_RE.sub(' ', name).strip(" -")
         return name
 
-    def _process_next_episode(self):
-        if self._current_ep_index >= len(self._episode_queue):
-            self._finish_show_add()
-            return
+    def _start_encoders(self, preset):
+        """Queue every episode and start up to MAX_PARALLEL_EPISODES workers."""
+        jobs = queue.Queue()
+        for idx, ep_data in enumerate(self._episode_queue):
+            jobs.put((idx, ep_data["source"], ep_data["dest"]))
+        worker_count = min(MAX_PARALLEL_EPISODES, len(self._episode_queue))
+        for _ in range(worker_count):
+            jobs.put(None)
 
-        total = len(self._episode_queue)
-        idx = self._current_ep_index
-        ep_data = self._episode_queue[idx]
         self.status_label.setText(
-            f"Processing episode {idx + 1} of {total}..."
-        )
-
-        self._compression_thread = CompressionThread(
-            ep_data["source"], ep_data["dest"], ep_data["preset"], parent=self
+            f"Processing {len(self._episode_queue)} episode(s)..."
         )
-        self._compression_thread.progress.connect(
-            lambda p: self._update_episode_progress(p, idx, total)
-        )
-        self._compression_thread.finished_signal.connect(self._on_episode_complete)
-        self._compression_thread.start()
-
-    def _update_episode_progress(self, percent, index, total):
-        # Overall progress = (completed episodes + current fraction) / total
-        overall = ((index + percent / 100.0) / total) * 100
-        self.progress_bar.setValue(int(overall))
-        self.status_label.setText(
-            f"Processing episode {index + 1} of {total}: {percent:.1f}%"
+        self._encoders = []
+        self._progress_timer.start()
+        for _ in range(worker_count):
+            encoder = EncoderQueueThread(jobs, preset, parent=self)
+            encoder.job_progress.connect(self._update_episode_progress)
+            encoder.job_finished.connect(self._on_episode_complete)
+            self._encoders.append(encoder)
+            encoder.start()
+
+    @Slot(int, float)
+    def _update_episode_progress(self, index, percent):
+        # Ignore workers that were already dropped by a cancel
+        if self.sender() not in self._encoders:
+            return
+        # Overall progress = sum of per-episode percentages / total
+        total = len(self._episode_queue)
+        self._episode_progress[index] = percent
+        overall = sum(self._episode_progress.values()) / total
+        self._latest_progress = (
+            int(overall), f"Processing episode {index + 1} of {total}: {percent:.1f}%"
         )
 
-    @Slot(bool, str)
-    def _on_episode_complete(self, success, message):
-        if not success:
-            QMessageBox.warning(self, "Episode Error",
-                f"Episode {self._current_ep_index + 1} failed:\n{message}\n\nSkipping...")
+    @Slot(int, bool, str)
+    def _on_episode_complete(self, index, success, message):
+        if self.sender() not in self._encoders:
+            return
 
-        ep_data = self._episode_queue[self._current_ep_index]
+        self._episodes_done += 1
         if success:
-            self.db.add_episode(
-                season_id=ep_data["season_id"],
-                episode_number=ep_data["episode_number"],
-                title=ep_data["title"],
-                movie_path=ep_data["rel_path"]
-            )
+            self._episode_progress[index] = 100.0
+            self._completed_episodes.append(self._episode_queue[index])
+        else:
+            # A modal box here would run a nested event loop that lets the
+            # other encoder's completion re-enter this slot; report at the end
+            self._episode_progress[index] = 0.0
+            self._episode_failures.append((index, message))
+
+        if self._episodes_done == len(self._episode_queue):
+            self._encoders = []
+            self._finish_show_add()
 
-        self._current_ep_index += 1
-        self._process_next_episode()
+    def _save_completed_episodes(self):
+        """Write all finished episodes to the DB in a single transaction."""
+        if not self._completed_episodes:
+            return
+        # Episodes can finish out of order when run in parallel
+        episodes = sorted(self._completed_episodes, key=lambda ep: ep["episode_number"])
+        self.db.add_episodes(episodes[0]["season_id"], [
+            (ep["episode_number"], ep["title"], ep["rel_path"])
+            for ep in episodes
+        ])
+        self._completed_episodes = []
 
     def _finish_show_add(self):
+        self._stop_progress_updates()
+        self._save_completed_episodes()
         show_id = self._pending_data["show_id"]
         self.progress_bar.setValue(100)
         self.status_label.setText("Show added successfully!")
+        self._is_processing = False
         self.show_added.emit(show_id)
+        if self._episode_failures:
+            failures = "\n\n".join(f"Episode {index + 1}: {message}"
+                                   for index, message in sorted(self._episode_failures))
+            self._episode_failures = []
+            QMessageBox.warning(self, "Episode Error",
+                f"Some episodes failed and were skipped:\n\n{failures}")
         QTimer.singleShot(800, self.accept)
 
     # ---- Movie completion ----------------------------------------------------------------------
 
     @Slot(float)
     def _update_progress(self, percent):
-        self.progress_bar.setValue(int(percent))
-        if percent < 100:
-            self.status_label.setText(f"Processing: {percent:.1f}%")
+        # Painted by _flush_progress so ffmpeg's output rate can't flood the UI
+        text = f"Processing: {percent:.1f}%" if percent < 100 else None
+        self._latest_progress = (int(percent), text)
+
+    def _flush_progress(self):
+        if self._latest_progress is None:
+            return
+        value, text = self._latest_progress
+        self._latest_progress = None
+        self.progress_bar.setValue(value)
+        if text is not None:
+            self.status_label.setText(text)
+
+    def _stop_progress_updates(self):
+        self._progress_timer.stop()
+        self._latest_progress = None
 
     @Slot(bool, str)
     def _on_single_complete(self, success, message):
+        # Dropped by a cancel
+        if self.sender() is not self._compression_thread:
+            return
+        self._stop_progress_updates()
         if not success:
             QMessageBox.critical(self, "Error", f"Failed to process movie:\n{message}")
             try:
@@ -671,23 +975,68 @@ class AddMovieDialog(QDialog):
         )
         self.progress_bar.setValue(100)
         self.status_label.setText("Movie added successfully!")
+        self._is_processing = False
+        self._compression_thread = None
         self.movie_added.emit(movie_id)
         QTimer.singleShot(800, self.accept)
 
     # ---- Cancel / Reset --------------------------------------------------------------------------
 
     def _on_cancel(self):
-        if self._is_processing:
-            if self._compression_thread:
-                self._compression_thread.cancel()
-                self._compression_thread.wait(2000)
-                self._compression_thread = None
-            self._is_processing = False
-            self._reset_ui()
-        else:
+        if not self._is_processing:
             self.reject()
+            return
+        if self._cancelling:
+            return
+
+        # Detach every worker so their late signals are ignored, then wait
+        # for them on the event loop rather than blocking in wait().
+        workers = [t for t in (self._staging_thread, self._compression_thread)
+                   if t is not None] + self._encoders
+        self._staging_thread = None
+        self._compression_thread = None
+        self._encoders = []
+        self._stop_progress_updates()
+
+        # Keep episodes that finished before the cancel
+        if self._pending_data.get("type") == "show":
+            self._save_completed_episodes()
+
+        for worker in workers:
+            worker.finished.connect(self._on_cancelled_worker_finished)
+            if hasattr(worker, "cancel"):
+                worker.cancel()
+        self._cancelling = [w for w in workers if w.isRunning()]
+        if not self._cancelling:
+            self._finish_cancel()
+            return
+
+        self.cancel_btn.setEnabled(False)
+        self.status_label.setText("Cancelling...")
+        self._cancel_generation += 1
+        generation = self._cancel_generation
+        QTimer.singleShot(self.CANCEL_TIMEOUT_MS,
+                          lambda: self._finish_cancel(generation))
+
+    def _on_cancelled_worker_finished(self):
+        if self.sender() in self._cancelling:
+            self._cancelling.remove(self.sender())
+            if not self._cancelling:
+                self._finish_cancel()
+
+    def _finish_cancel(self, generation=None):
+        # Backstop timers from an earlier cancel are stale
+        if generation is not None and generation != self._cancel_generation:
+            return
+        if not self._is_processing:
+            return
+        self._cancel_generation += 1
+        self._cancelling = []
+        self.cancel_btn.setEnabled(True)
+        self._reset_ui()
 
     def _reset_ui(self):
+        self._stop_progress_updates()
         self._is_processing = False
         self.add_btn.setEnabled(True)
         self.cancel_btn.setText("Cancel")
@@ -4,43 +4,70 @@ Contains the library browser grid with continue watching section,
 dark mode toggle, and manages navigation to player and show detail.
 """
 
+import heapq
 import os
 import shutil
+import string
+from collections import OrderedDict
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                                 QLabel, QLineEdit, QPushButton, QComboBox,
-                                QScrollArea, QGridLayout, QStackedWidget,
-                                QMessageBox, QFrame, QSizePolicy,
-                                QGraphicsDropShadowEffect, QInputDialog)
-from PySide6.QtCore import Qt, QTimer, Slot, QSize
-from PySide6.QtGui import QFont, QColor
+                                QScrollArea, QStackedWidget,
+                                QMessageBox, QFrame, QSizePolicy, QInputDialog)
+from PySide6.QtCore import Qt, QTimer, Slot, Signal, QSize, QThread, QPoint, QRect
+from PySide6.QtGui import QFont, QColor, QImage
 
 from database import Database, Movie, Show, Episode
-from ui.movie_card import MovieCard, ShowCard, ContinueCard, POSTER_WIDTH
+from ui.movie_card import (MovieCard, ShowCard, ContinueCard, POSTER_WIDTH,
+                           CARD_WIDTH, CARD_HEIGHT, prefetch_poster, poster_from_image)
 from ui.player_widget import PlayerWidget
-from ui.add_movie_dialog import AddMovieDialog
 from ui.show_detail_widget import ShowDetailWidget
-from ui.styles import LIGHT_THEME, DARK_THEME
+from ui.styles import LIGHT_THEME, DARK_THEME, LIBRARY_PAGE
 from utils.paths import get_library_root, get_movies_dir, get_drive_free_space, format_file_size
+from utils.thumbnails import PosterMigrationThread, MIGRATION_SETTING
+
+# SQLite's NOCASE only folds ASCII; merge keys must match the DB's order
+_NOCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 
 class FlowLayout(QWidget):
+    """Card grid that only keeps widgets for the rows in (or just beyond)
+    the scroll viewport. Cards are recycled through per-kind pools and
+    placed by hand, so cost tracks the visible rows, not the library size."""
+    REARRANGE_DELAY_MS = 30
+    SPACING = 20
+    MARGIN_LEFT, MARGIN_TOP, MARGIN_BOTTOM = 24, 16, 24
+    OVERSCAN_ROWS = 1
+    PREFETCH_ROWS = 4  # posters warmed beyond the bound rows, in scroll direction
+    rearranged = Signal()
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._layout = QGridLayout(self)
-        self._layout.setSpacing(20)
-        self._layout.setContentsMargins(24, 16, 24, 24)
-        self._layout.setAlignment(Qt.AlignLeft | Qt.AlignTop)
-        self._cards = []
+        self._items = []
+        self._factories = {}
+        self._viewport = None
+        self._pool = {}  # kind -> every card ever created for that kind
+        self._bound = {}  # item index -> card currently showing it
+        self._bound_items = {}  # card -> item it was last bound to
+        self._bound_range = (0, 0)  # item indexes [first, last) with cards
+        self._last_top = 0
+        self._scroll_direction = 1  # 1 down, -1 up
         self._columns = 4
-
-    def clear(self):
-        for card in self._cards:
-            self._layout.removeWidget(card)
-            card.deleteLater()
-        self._cards.clear()
-
-    def add_card(self, card):
-        self._cards.append(card)
+        # Window drags send a resize per frame; reflow once they settle
+        self._rearrange_timer = QTimer(self)
+        self._rearrange_timer.setSingleShot(True)
+        self._rearrange_timer.setInterval(self.REARRANGE_DELAY_MS)
+        self._rearrange_timer.timeout.connect(self._rearrange)
+
+    def set_viewport(self, viewport: QWidget):
+        """The scroll area viewport (an ancestor) that decides which rows exist."""
+        self._viewport = viewport
+
+    def set_items(self, items, factories):
+        """Show (kind, item) pairs in order. Only visible rows get cards:
+        pooled cards of the same kind are rebound with update_item(), and
+        factories[kind](item) only runs when the pool is short."""
+        self._items = list(items)
+        self._factories = factories
         self._rearrange()
 
     def _rearrange(self):
@@ -49,14 +76,160 @@ class FlowLayout(QWidget):
             avail_width = parent.width() - 60
             card_width = POSTER_WIDTH + 30
             self._columns = max(2, avail_width // card_width)
-        for i, card in enumerate(self._cards):
-            row = i // self._columns
-            col = i % self._columns
-            self._layout.addWidget(card, row, col, Qt.AlignTop | Qt.AlignHCenter)
+        rows = -(-len(self._items) // self._columns)
+        self.setFixedHeight(self.MARGIN_TOP + self.MARGIN_BOTTOM
+                            + rows * (CARD_HEIGHT + self.SPACING) - min(rows, 1) * self.SPACING)
+        # Reflowed columns put items in new cells
+        self.update_visible_cards(relayout=True)
+
+    def _visible_rect(self) -> QRect:
+        if self._viewport is None or not self.isVisible():
+            return QRect()
+        top_left = self.mapFrom(self._viewport, QPoint(0, 0))
+        return QRect(top_left, self._viewport.size())
+
+    def update_visible_cards(self, relayout=False):
+        """Bind cards to the rows around the viewport and hide the rest.
+        Cards already showing the right item in view are left alone."""
+        visible = self._visible_rect()
+        row_height = CARD_HEIGHT + self.SPACING
+        if not visible.isEmpty() and visible.top() != self._last_top:
+            self._scroll_direction = 1 if visible.top() > self._last_top else -1
+            self._last_top = visible.top()
+        if visible.isEmpty() or not self._items:
+            first, last = 0, 0
+        else:
+            first_row = max(0, (visible.top() - self.MARGIN_TOP) // row_height
+                            - self.OVERSCAN_ROWS)
+            last_row = ((visible.bottom() - self.MARGIN_TOP) // row_height
+                        + self.OVERSCAN_ROWS)
+            first = first_row * self._columns
+            last = min(len(self._items), (last_row + 1) * self._columns)
+        self._bound_range = (first, last)
+
+        previous, self._bound = self._bound, {}
+        moved = relayout
+        for index, card in previous.items():
+            if first <= index < last and self._bound_items.get(card) is self._items[index][1]:
+                self._bound[index] = card
+        in_use = set(self._bound.values())
+        free = {kind: [c for c in pool if c not in in_use]
+                for kind, pool in self._pool.items()}
+
+        updates_were_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for index in range(first, last):
+                card = self._bound.get(index)
+                if card is None:
+                    kind, item = self._items[index]
+                    spare = free.get(kind)
+                    if spare:
+                        card = spare.pop()
+                        card.update_item(item)
+                    else:
+                        card = self._factories[kind](item)
+                        card.setParent(self)
+                        self._pool.setdefault(kind, []).append(card)
+                    self._bound_items[card] = item
+                    self._bound[index] = card
+                    moved = True
+                elif not relayout:
+                    continue
+                row, col = divmod(index, self._columns)
+                card.move(self.MARGIN_LEFT + col * (CARD_WIDTH + self.SPACING),
+                          self.MARGIN_TOP + row * (CARD_HEIGHT + self.SPACING))
+                # ShowCard.show is the Show, so avoid QWidget.show()
+                card.setVisible(True)
+            for spare in free.values():
+                for card in spare:
+                    self._bound_items.pop(card, None)
+                    card.setVisible(False)
+        finally:
+            self.setUpdatesEnabled(updates_were_enabled)
+        if moved:
+            self.rearranged.emit()
+
+    def request_visible_thumbs(self):
+        """Ask the bound cards to load their posters; cards are only bound
+        for rows in or next to the viewport. Posters for the next rows in
+        the scroll direction are then queued behind them."""
+        for card in self._bound.values():
+            card.request_thumb()
+
+        first, last = self._bound_range
+        ahead = self.PREFETCH_ROWS * self._columns
+        if self._scroll_direction > 0:
+            indexes = range(last, min(len(self._items), last + ahead))
+        else:
+            indexes = range(first - 1, max(-1, first - 1 - ahead), -1)
+        for index in indexes:
+            prefetch_poster(self._items[index][1].thumb_path, self._on_poster_prefetched)
+
+    @Slot(object, QImage)
+    def _on_poster_prefetched(self, key, image):
+        poster_from_image(key, image)
+
+    def schedule_rearrange(self):
+        self._rearrange_timer.start()
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        self._rearrange()
+        # Height follows the item count; only width changes the columns
+        if event.size().width() != event.oldSize().width():
+            self.schedule_rearrange()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.update_visible_cards()
+
+
+class _RemoveDirsThread(QThread):
+    """Deletes library folders whose catalog rows are already gone, then
+    removes any of prune_dirs left empty."""
+    finished_signal = Signal(list)  # messages for folders that could not be removed
+
+    def __init__(self, dirs, prune_dirs=(), parent=None):
+        super().__init__(parent)
+        self.dirs = list(dirs)
+        self.prune_dirs = list(prune_dirs)
+
+    def run(self):
+        errors = []
+        for d in self.dirs:
+            try:
+                shutil.rmtree(d)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                errors.append(str(e))
+        for d in self.prune_dirs:
+            # rmdir only succeeds on an empty folder, so no listing is needed
+            try:
+                os.rmdir(d)
+            except OSError:
+                pass
+        self.finished_signal.emit(errors)
+
+
+class _LibraryQueryThread(QThread):
+    """Runs the grid's movie and show queries off the GUI thread."""
+    finished_signal = Signal(object, list, list)  # (query, sort_by, ascending), movies, shows
+
+    def __init__(self, db, key, parent=None):
+        super().__init__(parent)
+        self.db = db
+        self.key = key
+
+    def run(self):
+        query, sort_by, ascending = self.key
+        if query:
+            movies = self.db.search_movies(query, sort_by, ascending, with_subtitles=False)
+            shows = self.db.search_shows(query, sort_by, ascending, with_seasons=False)
+        else:
+            movies = self.db.get_all_movies(sort_by, ascending, with_subtitles=False)
+            shows = self.db.get_all_shows(sort_by, ascending, with_seasons=False)
+        self.finished_signal.emit(self.key, movies, shows)
 
 
 class MainWindow(QMainWindow):
@@ -65,6 +238,10 @@ class MainWindow(QMainWindow):
     PAGE_PLAYER = 1
     PAGE_SHOW_DETAIL = 2
 
+    SEARCH_DEBOUNCE_MS = 300
+    POSTER_CHECK_MS = 50
+    QUERY_CACHE_SIZE = 8
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("BebeFlix")
@@ -76,35 +253,57 @@ class MainWindow(QMainWindow):
         self._sort_by = "date_added"
         self._sort_ascending = False
         self._search_query = ""
+        # (query, sort_by, ascending) -> (movies, shows), most recent last
+        self._query_cache = OrderedDict()
+        # (full listing, lowered movie titles, lowered show titles) for search
+        self._title_index = None
+        self._query_thread = None
+        self._query_stale = False
+        self._add_dialog = None  # built on first use, then reused
+        self._played = None  # (kind, id) started since the library was last shown
+        self._removal_threads = []
         self._dark_mode = self.db.get_setting("dark_mode", "0") == "1"
 
+        # Set the app stylesheet before building widgets so they are only
+        # polished once, not once per stylesheet change
+        self._apply_theme()
+
         self.stack = QStackedWidget()
         self.setCentralWidget(self.stack)
 
         self._setup_library_page()
         self._setup_player_page()
         self._setup_show_detail_page()
-        self._apply_theme()
         self._refresh_library()
+        self._start_poster_migration()
+
+    def _start_poster_migration(self):
+        """Shrink posters imported before thumbnails were pre-generated."""
+        self._poster_migration = None
+        if self.db.get_setting(MIGRATION_SETTING, "0") == "1":
+            return
+        self._poster_migration = PosterMigrationThread(self.db, self)
+        self._poster_migration.finished.connect(self._reload_library)
+        self._poster_migration.start()
 
     def _apply_theme(self):
         from PySide6.QtWidgets import QApplication
         app = QApplication.instance()
-        if self._dark_mode:
-            app.setStyleSheet(DARK_THEME)
-            self.dark_mode_btn.setText("Light")
-        else:
-            app.setStyleSheet(LIGHT_THEME)
-            self.dark_mode_btn.setText("Dark")
+        app.setStyleSheet(DARK_THEME if self._dark_mode else LIGHT_THEME)
+
+    def _theme_button_text(self) -> str:
+        return "Light" if self._dark_mode else "Dark"
 
     def _toggle_dark_mode(self):
         self._dark_mode = not self._dark_mode
         self.db.set_setting("dark_mode", "1" if self._dark_mode else "0")
         self._apply_theme()
+        self.dark_mode_btn.setText(self._theme_button_text())
         self._refresh_library()
 
     def _setup_library_page(self):
         library_page = QWidget()
+        library_page.setStyleSheet(LIBRARY_PAGE)
         layout = QVBoxLayout(library_page)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
@@ -113,25 +312,16 @@ class MainWindow(QMainWindow):
         header = QWidget()
         header.setFixedHeight(56)
         header.setObjectName("libraryHeader")
-        header.setStyleSheet("""
-            QWidget#libraryHeader {
-                border-bottom: 2px solid #F8BBD0;
-            }
-        """)
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(24, 0, 24, 0)
         header_layout.setSpacing(12)
 
         title_label = QLabel("BebeFlix")
-        title_label.setStyleSheet(
-            "font-size: 20px; font-weight: 800; color: #C2185B; background: transparent;")
+        title_label.setObjectName("appTitle")
         header_layout.addWidget(title_label)
 
         self.count_label = QLabel("0 items")
-        self.count_label.setStyleSheet("""
-            font-size: 12px; color: #D81B60; font-weight: 600;
-            background: #FCE4EC; padding: 4px 14px; border-radius: 12px;
-        """)
+        self.count_label.setObjectName("countBadge")
         header_layout.addWidget(self.count_label)
 
         header_layout.addStretch()
@@ -139,31 +329,16 @@ class MainWindow(QMainWindow):
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search library...")
         self.search_input.setFixedWidth(240)
-        self.search_input.setStyleSheet("""
-            QLineEdit {
-                background-color: #F5F5F5; color: #2C2C2C;
-                border: 2px solid #E0E0E0; border-radius: 18px;
-                padding: 7px 18px; font-size: 13px;
-            }
-            QLineEdit:focus { border: 2px solid #F48FB1; background-color: #FFFFFF; }
-            QLineEdit::placeholder { color: #BDBDBD; }
-        """)
+        self.search_input.setObjectName("librarySearch")
         self.search_input.textChanged.connect(self._on_search_changed)
         header_layout.addWidget(self.search_input)
 
         sort_label = QLabel("Sort:")
-        sort_label.setStyleSheet(
-            "color: #9E9E9E; font-weight: 600; font-size: 12px; background: transparent;")
+        sort_label.setObjectName("sortLabel")
         header_layout.addWidget(sort_label)
 
         self.sort_combo = QComboBox()
-        self.sort_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #F5F5F5; border: 2px solid #E0E0E0;
-                border-radius: 14px; padding: 5px 14px; min-width: 120px; font-size: 12px;
-            }
-            QComboBox:hover { border-color: #F48FB1; }
-        """)
+        self.sort_combo.setObjectName("sortCombo")
         self.sort_combo.addItem("Newest First", ("date_added", False))
         self.sort_combo.addItem("Oldest First", ("date_added", True))
         self.sort_combo.addItem("Title A -> Z", ("title", True))
@@ -172,29 +347,15 @@ class MainWindow(QMainWindow):
         header_layout.addWidget(self.sort_combo)
 
         # Dark mode toggle
-        self.dark_mode_btn = QPushButton("Dark")
+        self.dark_mode_btn = QPushButton(self._theme_button_text())
         self.dark_mode_btn.setCursor(Qt.PointingHandCursor)
-        self.dark_mode_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #F5F5F5; color: #757575; border: 2px solid #E0E0E0;
-                border-radius: 14px; padding: 6px 14px; font-size: 12px; font-weight: 600;
-                min-width: 50px;
-            }
-            QPushButton:hover { border-color: #F48FB1; color: #D81B60; }
-        """)
+        self.dark_mode_btn.setObjectName("themeButton")
         self.dark_mode_btn.clicked.connect(self._toggle_dark_mode)
         header_layout.addWidget(self.dark_mode_btn)
 
         self.add_btn = QPushButton("+ Add")
         self.add_btn.setCursor(Qt.PointingHandCursor)
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #EC407A; color: #FFFFFF; border: none;
-                border-radius: 16px; padding: 8px 22px; font-size: 13px; font-weight: bold;
-            }
-            QPushButton:hover { background-color: #D81B60; }
-            QPushButton:pressed { background-color: #C2185B; }
-        """)
+        self.add_btn.setObjectName("addButton")
         self.add_btn.clicked.connect(self._on_add_content)
         header_layout.addWidget(self.add_btn)
         layout.addWidget(header)
@@ -204,7 +365,7 @@ class MainWindow(QMainWindow):
         self.scroll_area.setWidgetResizable(True)
         self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.scroll_area.setStyleSheet("QScrollArea { border: none; }")
+        self.scroll_area.setObjectName("libraryScroll")
 
         scroll_content = QWidget()
         self.scroll_layout = QVBoxLayout(scroll_content)
@@ -218,8 +379,7 @@ class MainWindow(QMainWindow):
         cw_layout.setSpacing(8)
 
         cw_header = QLabel("Continue Watching")
-        cw_header.setStyleSheet(
-            "font-size: 16px; font-weight: 700; color: #C2185B; background: transparent;")
+        cw_header.setObjectName("cwHeader")
         cw_layout.addWidget(cw_header)
 
         self.cw_scroll = QScrollArea()
@@ -227,7 +387,7 @@ class MainWindow(QMainWindow):
         self.cw_scroll.setWidgetResizable(True)
         self.cw_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.cw_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.cw_scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
+        self.cw_scroll.setObjectName("cwScroll")
 
         self.cw_container = QWidget()
         self.cw_container.setStyleSheet("background: transparent;")
@@ -240,7 +400,7 @@ class MainWindow(QMainWindow):
 
         cw_divider = QFrame()
         cw_divider.setFixedHeight(1)
-        cw_divider.setStyleSheet("background-color: #F0F0F0; border: none;")
+        cw_divider.setObjectName("cwDivider")
         cw_layout.addWidget(cw_divider)
 
         self.cw_section.setVisible(False)
@@ -248,20 +408,28 @@ class MainWindow(QMainWindow):
 
         # Library label
         self.library_section_label = QLabel("Library")
-        self.library_section_label.setStyleSheet(
-            "font-size: 16px; font-weight: 700; color: #C2185B; "
-            "background: transparent; padding: 16px 24px 4px 24px;")
+        self.library_section_label.setObjectName("librarySectionLabel")
         self.library_section_label.setVisible(False)
         self.scroll_layout.addWidget(self.library_section_label)
 
         # Grid
         self.grid_container = FlowLayout()
+        self.grid_container.set_viewport(self.scroll_area.viewport())
         self.scroll_layout.addWidget(self.grid_container)
         self.scroll_layout.addStretch()
 
         self.scroll_area.setWidget(scroll_content)
         layout.addWidget(self.scroll_area)
 
+        # Cards follow the scroll position; posters load once it settles
+        self._poster_timer = QTimer(self)
+        self._poster_timer.setSingleShot(True)
+        self._poster_timer.setInterval(self.POSTER_CHECK_MS)
+        self._poster_timer.timeout.connect(self.grid_container.request_visible_thumbs)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            lambda _: self.grid_container.update_visible_cards())
+        self.grid_container.rearranged.connect(self._poster_timer.start)
+
         # Empty state
         self.empty_widget = QWidget()
         empty_layout = QVBoxLayout(self.empty_widget)
@@ -269,20 +437,17 @@ class MainWindow(QMainWindow):
 
         empty_icon = QLabel("(empty)")
         empty_icon.setAlignment(Qt.AlignCenter)
-        empty_icon.setStyleSheet("font-size: 48px; background: transparent; color: #E0E0E0;")
+        empty_icon.setObjectName("emptyIcon")
         empty_layout.addWidget(empty_icon)
 
         self.empty_label = QLabel("Your library is empty!")
         self.empty_label.setAlignment(Qt.AlignCenter)
-        self.empty_label.setStyleSheet(
-            "font-size: 20px; font-weight: 700; color: #EC407A; "
-            "background: transparent; margin-top: 8px;")
+        self.empty_label.setObjectName("emptyTitle")
         empty_layout.addWidget(self.empty_label)
 
         self.empty_subtitle = QLabel("Click '+ Add' to add movies or TV shows")
         self.empty_subtitle.setAlignment(Qt.AlignCenter)
-        self.empty_subtitle.setStyleSheet(
-            "font-size: 14px; color: #9E9E9E; background: transparent; margin-top: 4px;")
+        self.empty_subtitle.setObjectName("emptySubtitle")
         empty_layout.addWidget(self.empty_subtitle)
 
         self.empty_widget.setVisible(False)
@@ -332,6 +497,7 @@ class MainWindow(QMainWindow):
             # Refresh from DB for latest position
             fresh = self.db.get_movie(movie.id)
             if fresh:
+                self._played = ("movie", fresh.id)
                 self.stack.setCurrentIndex(self.PAGE_PLAYER)
                 self.player.load_movie(fresh)
         else:
@@ -350,6 +516,7 @@ class MainWindow(QMainWindow):
                             ep_index = len(episode_list)
                         episode_list.append(s_ep)
 
+            self._played = ("episode", ep.id)
             self.stack.setCurrentIndex(self.PAGE_PLAYER)
             # Use the fresh episode from the show data if available
             fresh_ep = episode_list[ep_index] if 0 <= ep_index < len(episode_list) else ep
@@ -357,32 +524,157 @@ class MainWindow(QMainWindow):
 
     # ---- Library Refresh -------------------------------------------------------------------------
 
-    def _refresh_library(self):
-        self._refresh_continue_watching()
-        self.grid_container.clear()
-
-        if self._search_query:
-            movies = self.db.search_movies(
-                self._search_query, self._sort_by, self._sort_ascending)
-            shows = self.db.search_shows(
-                self._search_query, self._sort_by, self._sort_ascending)
-        else:
-            movies = self.db.get_all_movies(self._sort_by, self._sort_ascending)
-            shows = self.db.get_all_shows(self._sort_by, self._sort_ascending)
+    def _load_grid(self):
+        """Show the current search and sort, reusing recent results so
+        retyping or re-sorting skips the database; misses are queried on a
+        worker so a slow drive never stalls typing."""
+        key = (self._search_query, self._sort_by, self._sort_ascending)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+        elif self._search_query:
+            cached = self._filter_full_listing(self._search_query)
+        if cached is not None:
+            self._show_grid(*cached)
+            return
 
-        # Merge and sort together
-        items = []
-        for m in movies:
-            items.append(("movie", m, m.date_added, m.title))
-        for s in shows:
-            items.append(("show", s, s.date_added, s.title))
+        # One query at a time; anything asked for meanwhile re-runs after it
+        if self._query_thread is not None:
+            self._query_stale = True
+            return
+        self._query_thread = _LibraryQueryThread(self.db, key, self)
+        self._query_thread.finished_signal.connect(self._on_library_queried)
+        self._query_thread.finished.connect(self._query_thread.deleteLater)
+        self._query_thread.start()
+
+    def _full_listing(self):
+        """Cached (movies, shows) for the whole library in the current sort."""
+        return self._query_cache.get(("", self._sort_by, self._sort_ascending))
+
+    def _filter_full_listing(self, query):
+        """Filter the cached full listing by title, or None if the database
+        has to answer. Only queries the database would run through its
+        trigram index are filtered here: that index matches literally with
+        Unicode case folding, like lower() below, while shorter queries use
+        LIKE with wildcards and ASCII-only folding. The result keeps the
+        listing's order and is cheap enough not to cache."""
+        if not self.db.search_uses_fts(query):
+            return None
+        full = self._full_listing()
+        if full is None:
+            return None
+        # Lower the titles once per listing rather than on every keystroke
+        if self._title_index is None or self._title_index[0] is not full:
+            self._title_index = (full, *([item.title.lower() for item in items]
+                                         for items in full))
+        needle = query.lower()
+        return tuple([item for item, title in zip(items, titles) if needle in title]
+                     for items, titles in zip(full, self._title_index[1:]))
+
+    @Slot(object, list, list)
+    def _on_library_queried(self, key, movies, shows):
+        self._query_thread = None
+        if self._query_stale:
+            # The catalog, search or sort changed while this query ran
+            self._query_stale = False
+            self._load_grid()
+            return
+        self._query_cache[key] = (movies, shows)
+        if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        if key == (self._search_query, self._sort_by, self._sort_ascending):
+            self._show_grid(movies, shows)
+
+    def _reload_library(self):
+        """Refresh after the catalog changed, dropping cached query results."""
+        self._query_cache.clear()
+        self._refresh_library()
 
+    def _item_sort_key(self):
+        """Key matching the database ORDER BY for the current sort."""
         if self._sort_by == "title":
-            items.sort(key=lambda x: x[3].lower(), reverse=not self._sort_ascending)
+            return lambda item: item.title.translate(_NOCASE)
+        return lambda item: item.date_added or ""
+
+    def _on_item_added(self, kind, item_id):
+        """Fold one new or grown movie/show into the cached full listing so
+        the grid refreshes without re-querying the whole library."""
+        key = ("", self._sort_by, self._sort_ascending)
+        cached = self._query_cache.get(key)
+        item = self.db.get_movie(item_id) if kind == "movie" else self.db.get_show(item_id)
+        if self._search_query or cached is None or item is None:
+            self._reload_library()
+            return
+
+        items = cached[0] if kind == "movie" else cached[1]
+        for i, existing in enumerate(items):
+            if existing.id == item_id:
+                # A season added to a listed show: same place, new counts
+                items[i] = item
+                break
         else:
-            items.sort(key=lambda x: x[2] or "", reverse=not self._sort_ascending)
+            item_key = self._item_sort_key()
+            new_key = item_key(item)
+            for i, existing in enumerate(items):
+                if (new_key < item_key(existing) if self._sort_ascending
+                        else new_key > item_key(existing)):
+                    items.insert(i, item)
+                    break
+            else:
+                items.append(item)
 
-        total_items = len(items)
+        # Other cached searches and sorts may be missing the item
+        self._query_cache.clear()
+        self._query_cache[key] = cached
+        self._title_index = None
+        self._query_stale = self._query_thread is not None
+        self._refresh_library()
+
+    def _on_item_removed(self, kind, item_id):
+        """Drop a deleted movie/show from every cached listing and refresh;
+        removing an item never changes the order of the rest."""
+        index = 0 if kind == "movie" else 1
+        for cached in self._query_cache.values():
+            cached[index][:] = [item for item in cached[index] if item.id != item_id]
+        self._title_index = None
+        # A query still running may predate the delete
+        self._query_stale = self._query_thread is not None
+        self._refresh_library()
+
+    def _make_movie_card(self, movie):
+        card = MovieCard(movie)
+        card.clicked.connect(self._on_movie_clicked)
+        card.delete_requested.connect(self._on_delete_movie)
+        card.rename_requested.connect(self._on_rename_movie)
+        return card
+
+    def _make_show_card(self, show):
+        card = ShowCard(show)
+        card.clicked.connect(self._on_show_clicked)
+        card.delete_requested.connect(self._on_delete_show)
+        card.rename_requested.connect(self._on_rename_show)
+        return card
+
+    def _refresh_library(self):
+        self._refresh_continue_watching()
+        self._load_grid()
+
+    def _show_grid(self, movies, shows):
+        self.grid_container.setUpdatesEnabled(False)
+        try:
+            self._populate_grid(movies, shows)
+        finally:
+            self.grid_container.setUpdatesEnabled(True)
+
+    def _populate_grid(self, movies, shows):
+        # Both lists arrive sorted from the DB, so a linear merge is enough
+        item_key = self._item_sort_key()
+        items = list(heapq.merge(
+            (("movie", m) for m in movies), (("show", s) for s in shows),
+            key=lambda entry: item_key(entry[1]), reverse=not self._sort_ascending))
+
+        self.grid_container.set_items(
+            items, {"movie": self._make_movie_card, "show": self._make_show_card})
 
         if not items:
             self.empty_widget.setVisible(True)
@@ -396,26 +688,17 @@ class MainWindow(QMainWindow):
         else:
             self.empty_widget.setVisible(False)
             self.scroll_area.setVisible(True)
-            for kind, item, _, _ in items:
-                if kind == "movie":
-                    card = MovieCard(item)
-                    card.clicked.connect(self._on_movie_clicked)
-                    card.delete_requested.connect(self._on_delete_movie)
-                    card.rename_requested.connect(self._on_rename_movie)
-                    self.grid_container.add_card(card)
-                else:
-                    card = ShowCard(item)
-                    card.clicked.connect(self._on_show_clicked)
-                    card.delete_requested.connect(self._on_delete_show)
-                    card.rename_requested.connect(self._on_rename_show)
-                    self.grid_container.add_card(card)
-
-        movie_count = self.db.get_movie_count()
-        show_count = self.db.get_show_count()
+
         try:
             free = get_drive_free_space()
             self.count_label.setText(f"{format_file_size(free)} free")
         except Exception:
+            # Unfiltered lists are the whole library
+            full = self._full_listing() if self._search_query else (movies, shows)
+            if full is not None:
+                movie_count, show_count = len(full[0]), len(full[1])
+            else:
+                movie_count, show_count, _, _ = self.db.get_library_stats()
             parts = []
             if movie_count:
                 parts.append(f"{movie_count} movie{'s' if movie_count != 1 else ''}")
@@ -427,27 +710,35 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def _on_search_changed(self):
-        self._search_query = self.search_input.text().strip()
+        query = self.search_input.text().strip()
+        if query == self._search_query:
+            return
+        self._search_query = query
         if not hasattr(self, '_search_timer'):
             self._search_timer = QTimer(self)
             self._search_timer.setSingleShot(True)
-            self._search_timer.timeout.connect(self._refresh_library)
-        self._search_timer.start(200)
+            self._search_timer.timeout.connect(self._load_grid)
+        self._search_timer.start(self.SEARCH_DEBOUNCE_MS)
 
     @Slot(int)
     def _on_sort_changed(self, index):
         data = self.sort_combo.currentData()
         if data:
             self._sort_by, self._sort_ascending = data
-            self._refresh_library()
+            self._load_grid()
 
     @Slot(Movie)
     def _on_movie_clicked(self, movie):
+        # Grid cards are loaded without subtitles; fetch the full movie now
+        movie = self.db.get_movie(movie.id) or movie
+        self._played = ("movie", movie.id)
         self.stack.setCurrentIndex(self.PAGE_PLAYER)
         self.player.load_movie(movie)
 
     @Slot(Show)
     def _on_show_clicked(self, show):
+        # Grid cards only carry counts; fetch seasons and episodes now
+        show = self.db.get_show(show.id) or show
         self.show_detail.load_show(show)
         self.stack.setCurrentIndex(self.PAGE_SHOW_DETAIL)
 
@@ -462,11 +753,13 @@ class MainWindow(QMainWindow):
                     if ep.id == episode.id:
                         ep_index = len(episode_list)
                     episode_list.append(ep)
+        self._played = ("episode", episode.id)
         self.stack.setCurrentIndex(self.PAGE_PLAYER)
         self.player.load_episode(episode, show_title, episode_list, ep_index)
 
     @Slot(Show)
     def _on_add_season(self, show):
+        from ui.add_movie_dialog import AddMovieDialog
         next_season = self.db.get_next_season_number(show.id)
         dialog = AddMovieDialog(
             self.db, self, mode="show",
@@ -479,7 +772,7 @@ class MainWindow(QMainWindow):
         show = self.db.get_show(show_id)
         if show:
             self.show_detail.load_show(show)
-        self._refresh_library()
+        self._on_item_added("show", show_id)
 
     # ---- Rename ----------------------------------------------------------------------------------
 
@@ -490,7 +783,7 @@ class MainWindow(QMainWindow):
         )
         if ok and new_title.strip():
             self.db.rename_movie(movie.id, new_title.strip())
-            self._refresh_library()
+            self._reload_library()
 
     @Slot(Show)
     def _on_rename_show(self, show):
@@ -499,7 +792,7 @@ class MainWindow(QMainWindow):
         )
         if ok and new_title.strip():
             self.db.rename_show(show.id, new_title.strip())
-            self._refresh_library()
+            self._reload_library()
 
     # ---- Delete ----------------------------------------------------------------------------------
 
@@ -514,72 +807,98 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             deleted = self.db.delete_movie(movie.id)
             if deleted:
+                # The row is gone, so the grid can refresh while files are removed
                 movie_abs = os.path.join(get_library_root(), movie.movie_path)
-                movie_dir = os.path.dirname(movie_abs)
-                try:
-                    if os.path.exists(movie_dir):
-                        shutil.rmtree(movie_dir)
-                except Exception as e:
-                    QMessageBox.warning(self, "Warning",
-                        f"Removed from library but some files could not be deleted:\n{e}")
-            self._refresh_library()
+                self._remove_dirs_in_background([os.path.dirname(movie_abs)])
+            self._on_item_removed("movie", movie.id)
 
     @Slot(Show)
     def _on_delete_show(self, show):
-        ep_count = sum(len(s.episodes) for s in show.seasons)
+        show = self.db.get_show(show.id) or show
         reply = QMessageBox.question(
             self, "Delete Show",
             f"Are you sure you want to permanently delete \"{show.title}\"?\n\n"
-            f"This will remove {len(show.seasons)} season(s) and {ep_count} episode(s).",
+            f"This will remove {show.season_count} season(s) and {show.episode_count} episode(s).",
             QMessageBox.Yes | QMessageBox.No, QMessageBox.No
         )
         if reply == QMessageBox.Yes:
+            root = get_library_root()
             dirs_to_delete = set()
             for season in show.seasons:
                 for ep in season.episodes:
-                    ep_abs = os.path.join(get_library_root(), ep.movie_path)
+                    ep_abs = os.path.join(root, ep.movie_path)
                     dirs_to_delete.add(os.path.dirname(ep_abs))
 
             if show.thumb_path:
-                thumb_abs = os.path.join(get_library_root(), show.thumb_path)
+                thumb_abs = os.path.join(root, show.thumb_path)
                 dirs_to_delete.add(os.path.dirname(thumb_abs))
 
             self.db.delete_show(show.id)
 
-            for d in dirs_to_delete:
-                try:
-                    if os.path.exists(d):
-                        shutil.rmtree(d)
-                except Exception:
-                    pass
-
+            # The rows are gone, so the grid can refresh while files are removed
             show_slug_dir = os.path.join(
                 get_movies_dir(), show.title.lower().replace(" ", "-"))
-            try:
-                if os.path.isdir(show_slug_dir) and not os.listdir(show_slug_dir):
-                    os.rmdir(show_slug_dir)
-            except Exception:
-                pass
+            self._remove_dirs_in_background(dirs_to_delete, [show_slug_dir])
+
+            self._on_item_removed("show", show.id)
 
-            self._refresh_library()
+    def _remove_dirs_in_background(self, dirs, prune_dirs=()):
+        thread = _RemoveDirsThread(dirs, prune_dirs, self)
+        thread.finished_signal.connect(self._on_dirs_removed)
+        thread.finished.connect(lambda: self._removal_threads.remove(thread))
+        self._removal_threads.append(thread)
+        thread.start()
+
+    @Slot(list)
+    def _on_dirs_removed(self, errors):
+        if errors:
+            QMessageBox.warning(self, "Warning",
+                "Removed from library but some files could not be deleted:\n"
+                + "\n".join(errors))
 
     @Slot()
     def _on_add_content(self):
-        dialog = AddMovieDialog(self.db, self)
-        dialog.movie_added.connect(lambda _: self._refresh_library())
-        dialog.show_added.connect(lambda _: self._refresh_library())
-        dialog.exec()
+        # Deferred: the dialog pulls in the ffmpeg tooling, only needed on import
+        from ui.add_movie_dialog import AddMovieDialog
+        # Kept between opens so the form, encoder probe and workers are built once
+        if self._add_dialog is None:
+            self._add_dialog = AddMovieDialog(self.db, self)
+            self._add_dialog.movie_added.connect(
+                lambda movie_id: self._on_item_added("movie", movie_id))
+            self._add_dialog.show_added.connect(
+                lambda show_id: self._on_item_added("show", show_id))
+        else:
+            self._add_dialog.reset()
+        self._add_dialog.exec()
 
     @Slot()
     def _show_library(self):
         self.stack.setCurrentIndex(self.PAGE_LIBRARY)
-        self._refresh_library()
+        # Only playback changes anything shown here: the position and duration
+        # on the played movie's card, and Continue Watching
+        played, self._played = self._played, None
+        if played is None:
+            return
+        kind, item_id = played
+        if kind == "movie":
+            self._on_item_added("movie", item_id)
+        else:
+            self._refresh_continue_watching()
 
     def closeEvent(self, event):
+        if self._poster_migration and self._poster_migration.isRunning():
+            self._poster_migration.requestInterruption()
+            self._poster_migration.wait()
+        # Let pending deletes finish so no half-removed folders are left
+        for thread in list(self._removal_threads):
+            thread.wait()
+        if self._query_thread is not None:
+            self._query_thread.wait()
         self.player.cleanup()
+        self.db.close()
         super().closeEvent(event)
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
         if hasattr(self, 'grid_container'):
-            self.grid_container._rearrange()
+            self.grid_container.schedule_rearrange()
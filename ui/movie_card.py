@@ -5,17 +5,179 @@ Cross-platform path normalization for poster loading.
 """
 
 import os
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel,
-                                QGraphicsDropShadowEffect, QMenu, QFrame)
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap, QCursor, QAction, QColor
+from collections import OrderedDict
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, QMenu, QFrame,
+                                QGraphicsScene, QGraphicsPixmapItem, QGraphicsBlurEffect)
+from PySide6.QtCore import (Qt, Signal, Slot, QObject, QRunnable, QThreadPool,
+                            QPoint, QRectF)
+from PySide6.QtGui import QPixmap, QImage, QCursor, QAction, QColor, QPainter
 
 from database import Movie, Show
 from utils.paths import get_library_root, normalize_path
 
 POSTER_WIDTH = 180
 POSTER_HEIGHT = 270
-
+# Outer size of MovieCard/ShowCard: poster plus title and padding
+CARD_WIDTH = POSTER_WIDTH + 10
+CARD_HEIGHT = POSTER_HEIGHT + 65
+
+# Scaled posters keyed by (path, mtime, width, height). QPixmap is implicitly
+# shared, so handing the same entry to many cards costs nothing.
+_POSTER_CACHE_SIZE = 512
+_poster_cache = OrderedDict()
+
+# Poster drop shadow, blurred once per poster size instead of on every repaint
+_SHADOW_BLUR = 20
+_SHADOW_OFFSET = 4
+_SHADOW_COLOR = QColor(244, 143, 177, 80)
+_shadow_cache = {}
+
+# Poster stylesheets, built once and shared by every card
+_POSTER_STYLE_LOADING = (
+    "QLabel { border-radius: 10px; background-color: #F5F5F5; border: 2px solid #F0F0F0; }")
+_POSTER_STYLE_NORMAL = "QLabel { border-radius: 10px; border: 2px solid #F0F0F0; }"
+_POSTER_STYLE_HOVER = "QLabel { border-radius: 10px; border: 3px solid #F48FB1; }"
+
+_PLACEHOLDER_QSS = """
+    QLabel {{
+        border-radius: {radius}px; background-color: {bg}; color: {fg};
+        font-size: {size}px; font-weight: bold; padding: {pad}px; border: {border};
+    }}
+"""
+_MOVIE_STYLE_MISSING = _PLACEHOLDER_QSS.format(
+    radius=10, bg="#FCE4EC", fg="#C2185B", size=14, pad=20, border="2px solid #F8BBD0")
+_MOVIE_STYLE_MISSING_HOVER = _PLACEHOLDER_QSS.format(
+    radius=10, bg="#FCE4EC", fg="#C2185B", size=14, pad=20, border="3px solid #F48FB1")
+_SHOW_STYLE_MISSING = _PLACEHOLDER_QSS.format(
+    radius=10, bg="#E8F5E9", fg="#2E7D32", size=14, pad=20, border="2px solid #A5D6A7")
+_SHOW_STYLE_MISSING_HOVER = _PLACEHOLDER_QSS.format(
+    radius=10, bg="#E8F5E9", fg="#2E7D32", size=14, pad=20, border="3px solid #F48FB1")
+
+_CONTINUE_STYLE_LOADING = (
+    "QLabel { border-radius: 8px; background-color: #F5F5F5; border: 2px solid #F0F0F0; }")
+_CONTINUE_STYLE_NORMAL = "QLabel { border-radius: 8px; border: 2px solid #F0F0F0; }"
+_CONTINUE_STYLE_HOVER = "QLabel { border-radius: 8px; border: 3px solid #F48FB1; }"
+_CONTINUE_STYLE_MISSING = _PLACEHOLDER_QSS.format(
+    radius=8, bg="#FCE4EC", fg="#C2185B", size=11, pad=10, border="2px solid #F8BBD0")
+_CONTINUE_TITLE_QSS = "font-size: 11px; font-weight: 600; background: transparent;"
+
+_PROGRESS_HIDDEN_QSS = "background-color: transparent; border: none;"
+
+
+def _scale_poster(image: QImage, width: int, height: int) -> QImage:
+    """Scale to cover width x height, then center-crop."""
+    scaled = image.scaled(width, height,
+        Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    if scaled.width() > width or scaled.height() > height:
+        x = (scaled.width() - width) // 2
+        y = (scaled.height() - height) // 2
+        scaled = scaled.copy(x, y, width, height)
+    return scaled
+
+
+def _shadow_pixmap(width: int, height: int) -> QPixmap:
+    """Return the blurred shadow for a width x height poster, padded by
+    _SHADOW_BLUR on every side."""
+    pixmap = _shadow_cache.get((width, height))
+    if pixmap is not None:
+        return pixmap
+
+    pad = _SHADOW_BLUR
+    shape = QPixmap(width + 2 * pad, height + 2 * pad)
+    shape.fill(Qt.transparent)
+    painter = QPainter(shape)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(_SHADOW_COLOR)
+    painter.drawRoundedRect(pad, pad, width, height, 10, 10)
+    painter.end()
+
+    # Run the blur through a throwaway scene once and keep the result
+    scene = QGraphicsScene()
+    item = QGraphicsPixmapItem(shape)
+    blur = QGraphicsBlurEffect()
+    blur.setBlurRadius(_SHADOW_BLUR)
+    item.setGraphicsEffect(blur)
+    scene.addItem(item)
+
+    pixmap = QPixmap(shape.size())
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    rect = QRectF(shape.rect())
+    scene.render(painter, rect, rect)
+    painter.end()
+
+    _shadow_cache[(width, height)] = pixmap
+    return pixmap
+
+
+def paint_poster_shadow(widget: QWidget, label: QWidget):
+    """Paint the cached poster shadow onto widget, behind label."""
+    origin = label.mapTo(widget, QPoint(0, 0))
+    painter = QPainter(widget)
+    painter.drawPixmap(origin.x() - _SHADOW_BLUR,
+                       origin.y() - _SHADOW_BLUR + _SHADOW_OFFSET,
+                       _shadow_pixmap(label.width(), label.height()))
+    painter.end()
+
+
+class _PosterSignals(QObject):
+    loaded = Signal(object, QImage)  # cache key, scaled image
+
+
+class PosterLoader(QRunnable):
+    """Decodes and scales a poster off the UI thread.
+    Works on QImage since QPixmap may only be touched from the GUI thread."""
+
+    def __init__(self, key):
+        super().__init__()
+        self.key = key
+        self.signals = _PosterSignals()
+
+    def run(self):
+        path, _, width, height = self.key
+        image = QImage(path)
+        if not image.isNull():
+            image = _scale_poster(image, width, height)
+        self.signals.loaded.emit(self.key, image)
+
+
+def request_poster(thumb_abs: str, width: int, height: int, on_loaded, priority: int = 0):
+    """Return the cached poster pixmap (null if the file is missing), or None
+    after queueing a background load that will call on_loaded(key, image).
+    Loads with a higher priority are started first."""
+    try:
+        mtime = os.path.getmtime(thumb_abs)
+    except OSError:
+        return QPixmap()
+    key = (thumb_abs, mtime, width, height)
+    pixmap = _poster_cache.get(key)
+    if pixmap is not None:
+        _poster_cache.move_to_end(key)
+        return pixmap
+    loader = PosterLoader(key)
+    loader.signals.loaded.connect(on_loaded)
+    QThreadPool.globalInstance().start(loader, priority)
+    return None
+
+
+def prefetch_poster(thumb_rel: str, on_loaded):
+    """Warm the cache with a grid card's poster ahead of the card being bound.
+    Queued behind visible cards; on_loaded should hand the image to
+    poster_from_image() on the GUI thread."""
+    thumb_abs = os.path.join(get_library_root(), normalize_path(thumb_rel))
+    request_poster(thumb_abs, POSTER_WIDTH, POSTER_HEIGHT, on_loaded, priority=-1)
+
+
+def poster_from_image(key, image: QImage) -> QPixmap:
+    """Convert a loaded image to a pixmap on the GUI thread and cache it."""
+    pixmap = QPixmap.fromImage(image)
+    if not pixmap.isNull():
+        _poster_cache[key] = pixmap
+        _poster_cache.move_to_end(key)
+        while len(_poster_cache) > _POSTER_CACHE_SIZE:
+            _poster_cache.popitem(last=False)
+    return pixmap
 
 
 class MovieCard(QWidget):
@@ -27,12 +189,19 @@ class MovieCard(QWidget):
         super().__init__(parent)
         self.movie = movie
         self._has_poster = False
+        self._poster_requested = False
+        self._thumb_abs = ""
         self._setup_ui()
+        self._bind()
+
+    def update_item(self, movie: Movie):
+        """Show a different movie, reusing this card's widgets."""
+        self.movie = movie
+        self._bind()
 
     def _setup_ui(self):
-        self.setFixedSize(POSTER_WIDTH + 10, POSTER_HEIGHT + 65)
+        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
         self.setCursor(QCursor(Qt.PointingHandCursor))
-        self.setToolTip(f"Click to play: {self.movie.title}")
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
@@ -49,20 +218,16 @@ class MovieCard(QWidget):
         self.poster_label = QLabel()
         self.poster_label.setFixedSize(POSTER_WIDTH, POSTER_HEIGHT - 4)
         self.poster_label.setAlignment(Qt.AlignCenter)
-        self.poster_label.setStyleSheet(
-            "QLabel { border-radius: 10px; background-color: #F5F5F5; border: 2px solid #F0F0F0; }")
-        self._load_thumbnail()
         poster_inner.addWidget(self.poster_label)
 
         # Progress bar at bottom of poster
         self.progress_bar = QFrame()
         self.progress_bar.setFixedHeight(4)
-        self._update_progress()
         poster_inner.addWidget(self.progress_bar)
 
         layout.addWidget(poster_container, alignment=Qt.AlignCenter)
 
-        self.title_label = QLabel(self.movie.title)
+        self.title_label = QLabel()
         self.title_label.setObjectName("movieTitle")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setWordWrap(True)
@@ -70,11 +235,26 @@ class MovieCard(QWidget):
         self.title_label.setMaximumHeight(54)
         layout.addWidget(self.title_label, alignment=Qt.AlignCenter)
 
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(244, 143, 177, 80))
-        self.poster_label.setGraphicsEffect(shadow)
+    def _bind(self):
+        self.setToolTip(f"Click to play: {self.movie.title}")
+        self.title_label.setText(self.movie.title)
+        self._has_poster = False
+        self._poster_requested = False
+        # Drop results still in flight for the previous item
+        self._thumb_abs = ""
+        self.poster_label.clear()
+        self.poster_label.setStyleSheet(_POSTER_STYLE_LOADING)
+        self._update_progress()
+
+    def request_thumb(self):
+        """Load the poster; the grid calls this once the card nears the viewport."""
+        if not self._poster_requested:
+            self._poster_requested = True
+            self._load_thumbnail()
+
+    def paintEvent(self, event):
+        paint_poster_shadow(self, self.poster_label)
+        super().paintEvent(event)
 
     def _update_progress(self):
         if self.movie.duration > 0 and self.movie.last_position > 0:
@@ -85,56 +265,44 @@ class MovieCard(QWidget):
                 f"stop:{pct/100 + 0.001:.3f} #40404040, stop:1 #40404040); "
                 f"border: none; border-radius: 2px;")
         else:
-            self.progress_bar.setStyleSheet("background-color: transparent; border: none;")
+            self.progress_bar.setStyleSheet(_PROGRESS_HIDDEN_QSS)
 
     def _load_thumbnail(self):
         thumb_rel = normalize_path(self.movie.thumb_path)
-        thumb_abs = os.path.join(get_library_root(), thumb_rel)
-        if os.path.exists(thumb_abs):
-            pixmap = QPixmap(thumb_abs)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(POSTER_WIDTH, POSTER_HEIGHT,
-                    Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                if scaled.width() > POSTER_WIDTH or scaled.height() > POSTER_HEIGHT:
-                    x = (scaled.width() - POSTER_WIDTH) // 2
-                    y = (scaled.height() - POSTER_HEIGHT) // 2
-                    scaled = scaled.copy(x, y, POSTER_WIDTH, POSTER_HEIGHT)
-                self.poster_label.setPixmap(scaled)
-                self._has_poster = True
-                return
+        self._thumb_abs = os.path.join(get_library_root(), thumb_rel)
+        pixmap = request_poster(self._thumb_abs, POSTER_WIDTH, POSTER_HEIGHT,
+                                self._on_poster_loaded)
+        if pixmap is not None:
+            self._apply_poster(pixmap)
+
+    @Slot(object, QImage)
+    def _on_poster_loaded(self, key, image):
+        pixmap = poster_from_image(key, image)
+        # The card may have been rebound to another movie while loading
+        if key[0] == self._thumb_abs:
+            self._apply_poster(pixmap)
+
+    def _apply_poster(self, pixmap):
+        if not pixmap.isNull():
+            self.poster_label.setPixmap(pixmap)
+            self._has_poster = True
+            return
 
         self.poster_label.setText(self.movie.title)
-        self.poster_label.setStyleSheet("""
-            QLabel {
-                border-radius: 10px; background-color: #FCE4EC; color: #C2185B;
-                font-size: 14px; font-weight: bold; padding: 20px; border: 2px solid #F8BBD0;
-            }
-        """)
+        self.poster_label.setStyleSheet(_MOVIE_STYLE_MISSING)
 
     def enterEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 10px; border: 3px solid #F48FB1; }")
+            self.poster_label.setStyleSheet(_POSTER_STYLE_HOVER)
         else:
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    border-radius: 10px; background-color: #FCE4EC; color: #C2185B;
-                    font-size: 14px; font-weight: bold; padding: 20px; border: 3px solid #F48FB1;
-                }
-            """)
+            self.poster_label.setStyleSheet(_MOVIE_STYLE_MISSING_HOVER)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 10px; border: 2px solid #F0F0F0; }")
+            self.poster_label.setStyleSheet(_POSTER_STYLE_NORMAL)
         else:
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    border-radius: 10px; background-color: #FCE4EC; color: #C2185B;
-                    font-size: 14px; font-weight: bold; padding: 20px; border: 2px solid #F8BBD0;
-                }
-            """)
+            self.poster_label.setStyleSheet(_MOVIE_STYLE_MISSING)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -164,18 +332,20 @@ class ShowCard(QWidget):
         super().__init__(parent)
         self.show = show
         self._has_poster = False
+        self._poster_requested = False
+        self._thumb_abs = ""
         self._setup_ui()
+        self._bind()
+
+    def update_item(self, show: Show):
+        """Show a different TV show, reusing this card's widgets."""
+        self.show = show
+        self._bind()
 
     def _setup_ui(self):
-        self.setFixedSize(POSTER_WIDTH + 10, POSTER_HEIGHT + 65)
+        self.setFixedSize(CARD_WIDTH, CARD_HEIGHT)
         self.setCursor(QCursor(Qt.PointingHandCursor))
 
-        ep_count = sum(len(s.episodes) for s in self.show.seasons)
-        self.setToolTip(
-            f"{self.show.title}\n"
-            f"{len(self.show.seasons)} season(s), {ep_count} episode(s)"
-        )
-
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(4)
@@ -183,12 +353,9 @@ class ShowCard(QWidget):
         self.poster_label = QLabel()
         self.poster_label.setFixedSize(POSTER_WIDTH, POSTER_HEIGHT)
         self.poster_label.setAlignment(Qt.AlignCenter)
-        self.poster_label.setStyleSheet(
-            "QLabel { border-radius: 10px; background-color: #F5F5F5; border: 2px solid #F0F0F0; }")
-        self._load_thumbnail()
         layout.addWidget(self.poster_label, alignment=Qt.AlignCenter)
 
-        self.title_label = QLabel(self.show.title)
+        self.title_label = QLabel()
         self.title_label.setObjectName("movieTitle")
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setWordWrap(True)
@@ -196,60 +363,65 @@ class ShowCard(QWidget):
         self.title_label.setMaximumHeight(54)
         layout.addWidget(self.title_label, alignment=Qt.AlignCenter)
 
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(20)
-        shadow.setOffset(0, 4)
-        shadow.setColor(QColor(244, 143, 177, 80))
-        self.poster_label.setGraphicsEffect(shadow)
+    def _bind(self):
+        self.setToolTip(
+            f"{self.show.title}\n"
+            f"{self.show.season_count} season(s), {self.show.episode_count} episode(s)"
+        )
+        self.title_label.setText(self.show.title)
+        self._has_poster = False
+        self._poster_requested = False
+        # Drop results still in flight for the previous item
+        self._thumb_abs = ""
+        self.poster_label.clear()
+        self.poster_label.setStyleSheet(_POSTER_STYLE_LOADING)
+
+    def request_thumb(self):
+        """Load the poster; the grid calls this once the card nears the viewport."""
+        if not self._poster_requested:
+            self._poster_requested = True
+            self._load_thumbnail()
+
+    def paintEvent(self, event):
+        paint_poster_shadow(self, self.poster_label)
+        super().paintEvent(event)
 
     def _load_thumbnail(self):
         thumb_rel = normalize_path(self.show.thumb_path)
-        thumb_abs = os.path.join(get_library_root(), thumb_rel)
-        if os.path.exists(thumb_abs):
-            pixmap = QPixmap(thumb_abs)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(POSTER_WIDTH, POSTER_HEIGHT,
-                    Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                if scaled.width() > POSTER_WIDTH or scaled.height() > POSTER_HEIGHT:
-                    x = (scaled.width() - POSTER_WIDTH) // 2
-                    y = (scaled.height() - POSTER_HEIGHT) // 2
-                    scaled = scaled.copy(x, y, POSTER_WIDTH, POSTER_HEIGHT)
-                self.poster_label.setPixmap(scaled)
-                self._has_poster = True
-                return
+        self._thumb_abs = os.path.join(get_library_root(), thumb_rel)
+        pixmap = request_poster(self._thumb_abs, POSTER_WIDTH, POSTER_HEIGHT,
+                                self._on_poster_loaded)
+        if pixmap is not None:
+            self._apply_poster(pixmap)
+
+    @Slot(object, QImage)
+    def _on_poster_loaded(self, key, image):
+        pixmap = poster_from_image(key, image)
+        # The card may have been rebound to another show while loading
+        if key[0] == self._thumb_abs:
+            self._apply_poster(pixmap)
+
+    def _apply_poster(self, pixmap):
+        if not pixmap.isNull():
+            self.poster_label.setPixmap(pixmap)
+            self._has_poster = True
+            return
 
         self.poster_label.setText(f"{self.show.title}\n\n[TV Show]")
-        self.poster_label.setStyleSheet("""
-            QLabel {
-                border-radius: 10px; background-color: #E8F5E9; color: #2E7D32;
-                font-size: 14px; font-weight: bold; padding: 20px; border: 2px solid #A5D6A7;
-            }
-        """)
+        self.poster_label.setStyleSheet(_SHOW_STYLE_MISSING)
 
     def enterEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 10px; border: 3px solid #F48FB1; }")
+            self.poster_label.setStyleSheet(_POSTER_STYLE_HOVER)
         else:
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    border-radius: 10px; background-color: #E8F5E9; color: #2E7D32;
-                    font-size: 14px; font-weight: bold; padding: 20px; border: 3px solid #F48FB1;
-                }
-            """)
+            self.poster_label.setStyleSheet(_SHOW_STYLE_MISSING_HOVER)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 10px; border: 2px solid #F0F0F0; }")
+            self.poster_label.setStyleSheet(_POSTER_STYLE_NORMAL)
         else:
-            self.poster_label.setStyleSheet("""
-                QLabel {
-                    border-radius: 10px; background-color: #E8F5E9; color: #2E7D32;
-                    font-size: 14px; font-weight: bold; padding: 20px; border: 2px solid #A5D6A7;
-                }
-            """)
+            self.poster_label.setStyleSheet(_SHOW_STYLE_MISSING)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
@@ -290,8 +462,7 @@ class ContinueCard(QWidget):
         self.poster_label = QLabel()
         self.poster_label.setFixedSize(132, 180)
         self.poster_label.setAlignment(Qt.AlignCenter)
-        self.poster_label.setStyleSheet(
-            "QLabel { border-radius: 8px; background-color: #F5F5F5; border: 2px solid #F0F0F0; }")
+        self.poster_label.setStyleSheet(_CONTINUE_STYLE_LOADING)
         self._load_thumbnail()
         layout.addWidget(self.poster_label, alignment=Qt.AlignCenter)
 
@@ -314,8 +485,7 @@ class ContinueCard(QWidget):
         self.title_label = QLabel(label_text)
         self.title_label.setAlignment(Qt.AlignCenter)
         self.title_label.setMaximumWidth(132)
-        self.title_label.setStyleSheet(
-            "font-size: 11px; font-weight: 600; background: transparent;")
+        self.title_label.setStyleSheet(_CONTINUE_TITLE_QSS)
         layout.addWidget(self.title_label, alignment=Qt.AlignCenter)
 
     def _update_progress(self):
@@ -328,7 +498,7 @@ class ContinueCard(QWidget):
                 f"stop:{pct/100 + 0.001:.3f} #40404040, stop:1 #40404040); "
                 f"border: none; border-radius: 1px;")
         else:
-            self.progress_bar.setStyleSheet("background-color: transparent; border: none;")
+            self.progress_bar.setStyleSheet(_PROGRESS_HIDDEN_QSS)
 
     def _load_thumbnail(self):
         if self.cw_item["type"] == "movie":
@@ -337,41 +507,35 @@ class ContinueCard(QWidget):
             thumb_rel = normalize_path(self.cw_item.get("show_thumb", ""))
 
         thumb_abs = os.path.join(get_library_root(), thumb_rel)
-        if os.path.exists(thumb_abs):
-            pixmap = QPixmap(thumb_abs)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(132, 180,
-                    Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                if scaled.width() > 132 or scaled.height() > 180:
-                    x = (scaled.width() - 132) // 2
-                    y = (scaled.height() - 180) // 2
-                    scaled = scaled.copy(x, y, 132, 180)
-                self.poster_label.setPixmap(scaled)
-                self._has_poster = True
-                return
+        pixmap = request_poster(thumb_abs, 132, 180, self._on_poster_loaded)
+        if pixmap is not None:
+            self._apply_poster(pixmap)
+
+    @Slot(object, QImage)
+    def _on_poster_loaded(self, key, image):
+        self._apply_poster(poster_from_image(key, image))
+
+    def _apply_poster(self, pixmap):
+        if not pixmap.isNull():
+            self.poster_label.setPixmap(pixmap)
+            self._has_poster = True
+            return
 
         item = self.cw_item["item"]
         if self.cw_item["type"] == "movie":
             self.poster_label.setText(item.title[:20])
         else:
             self.poster_label.setText(self.cw_item.get("show_title", "")[:20])
-        self.poster_label.setStyleSheet("""
-            QLabel {
-                border-radius: 8px; background-color: #FCE4EC; color: #C2185B;
-                font-size: 11px; font-weight: bold; padding: 10px; border: 2px solid #F8BBD0;
-            }
-        """)
+        self.poster_label.setStyleSheet(_CONTINUE_STYLE_MISSING)
 
     def enterEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 8px; border: 3px solid #F48FB1; }")
+            self.poster_label.setStyleSheet(_CONTINUE_STYLE_HOVER)
         super().enterEvent(event)
 
     def leaveEvent(self, event):
         if self._has_poster:
-            self.poster_label.setStyleSheet(
-                "QLabel { border-radius: 8px; border: 2px solid #F0F0F0; }")
+            self.poster_label.setStyleSheet(_CONTINUE_STYLE_NORMAL)
         super().leaveEvent(event)
 
     def mousePressEvent(self, event):
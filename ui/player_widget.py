@@ -15,12 +15,7 @@ from PySide6.QtGui import QKeySequence, QShortcut, QCursor
 from database import Movie, Episode, Database
 from utils.paths import get_library_root, normalize_path
 from utils.sleep_inhibit import SleepInhibitor
-
-try:
-    import vlc
-    VLC_AVAILABLE = True
-except (ImportError, OSError):
-    VLC_AVAILABLE = False
+from utils.vlc_loader import load_vlc
 
 
 def format_time(seconds: float) -> str:
@@ -48,6 +43,7 @@ class PlayerWidget(QWidget):
         self._current_ep_index = -1  # index into _episode_list
         self._show_title = ""
         self._autoplay = True
+        self._vlc = None             # python-vlc module, loaded on first play
         self._vlc_instance = None
         self._media_player = None
         self._media = None
@@ -366,7 +362,7 @@ class PlayerWidget(QWidget):
                 sub_abs = os.path.join(get_library_root(), sub_path)
                 if os.path.exists(sub_abs):
                     self._media_player.add_slave(
-                        vlc.MediaSlaveType.subtitle, f"file:///{sub_abs}", True)
+                        self._vlc.MediaSlaveType.subtitle, f"file:///{sub_abs}", True)
         self._update_episode_controls()
 
     def load_episode(self, episode: Episode, show_title: str = "",
@@ -392,11 +388,13 @@ class PlayerWidget(QWidget):
         self._update_episode_controls()
 
     def _load_media(self, file_path: str):
-        if not VLC_AVAILABLE:
+        if self._vlc is None:
+            self._vlc = load_vlc()
+        if self._vlc is None:
             self.movie_title_label.setText("VLC not available - install VLC to play movies")
             return
         if not self._vlc_instance:
-            self._vlc_instance = vlc.Instance()
+            self._vlc_instance = self._vlc.Instance()
         if not self._media_player:
             self._media_player = self._vlc_instance.media_player_new()
         if sys.platform == "win32":
@@ -668,7 +666,7 @@ class PlayerWidget(QWidget):
                     self.seek_slider.setValue(int((current / self._duration) * 1000))
                     self.seek_slider.blockSignals(False)
         state = self._media_player.get_state()
-        if state == vlc.State.Ended:
+        if state == self._vlc.State.Ended:
             self._is_playing = False
             self.play_pause_btn.setText("Play")
             self._update_timer.stop()
@@ -6,7 +6,7 @@ Displays seasons and episodes for a TV show, with ability to add more seasons.
 import os
 from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                                 QPushButton, QScrollArea, QFrame,
-                                QSizePolicy, QGraphicsDropShadowEffect)
+                                QSizePolicy)
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QPixmap, QColor
 
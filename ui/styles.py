@@ -3,6 +3,8 @@ Light theme stylesheet for BebeFlix.
 Clean white background with baby pink accents.
 """
 
+import re
+
 LIGHT_THEME = """
 QWidget {
     background-color: #FAFAFA;
@@ -155,37 +157,9 @@ QSlider::sub-page:horizontal {
     background: #F48FB1;
     border-radius: 3px;
 }
-QProgressBar {
-    border: none;
-    background-color: #F5F5F5;
-    border-radius: 6px;
-    height: 12px;
-    text-align: center;
-    color: transparent;
-}
-QProgressBar::chunk {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #F48FB1, stop:1 #EC407A);
-    border-radius: 6px;
-}
 QDialog {
     background-color: #FFFFFF;
 }
-QGroupBox {
-    border: 2px solid #F8BBD0;
-    border-radius: 12px;
-    margin-top: 14px;
-    padding-top: 18px;
-    font-weight: bold;
-    color: #D81B60;
-    background-color: #FFFBFC;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 16px;
-    padding: 0 8px;
-    color: #D81B60;
-}
 QCheckBox {
     spacing: 8px;
     color: #2C2C2C;
@@ -381,37 +355,9 @@ QSlider::sub-page:horizontal {
     background: #E94560;
     border-radius: 3px;
 }
-QProgressBar {
-    border: none;
-    background-color: #0F3460;
-    border-radius: 6px;
-    height: 12px;
-    text-align: center;
-    color: transparent;
-}
-QProgressBar::chunk {
-    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-        stop:0 #E94560, stop:1 #FF6B81);
-    border-radius: 6px;
-}
 QDialog {
     background-color: #16213E;
 }
-QGroupBox {
-    border: 2px solid #533483;
-    border-radius: 12px;
-    margin-top: 14px;
-    padding-top: 18px;
-    font-weight: bold;
-    color: #E94560;
-    background-color: #1A1A2E;
-}
-QGroupBox::title {
-    subcontrol-origin: margin;
-    left: 16px;
-    padding: 0 8px;
-    color: #E94560;
-}
 QCheckBox {
     spacing: 8px;
     color: #E0E0E0;
@@ -453,6 +399,70 @@ QToolTip {
     padding: 6px 12px;
     font-size: 12px;
 }
+"""
+
+# Only used by AddMovieDialog; applied to the dialog when it is opened so the
+# app-wide sheet stays small
+LIGHT_DIALOG = """
+QProgressBar {
+    border: none;
+    background-color: #F5F5F5;
+    border-radius: 6px;
+    height: 12px;
+    text-align: center;
+    color: transparent;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #F48FB1, stop:1 #EC407A);
+    border-radius: 6px;
+}
+QGroupBox {
+    border: 2px solid #F8BBD0;
+    border-radius: 12px;
+    margin-top: 14px;
+    padding-top: 18px;
+    font-weight: bold;
+    color: #D81B60;
+    background-color: #FFFBFC;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 16px;
+    padding: 0 8px;
+    color: #D81B60;
+}
+"""
+
+DARK_DIALOG = """
+QProgressBar {
+    border: none;
+    background-color: #0F3460;
+    border-radius: 6px;
+    height: 12px;
+    text-align: center;
+    color: transparent;
+}
+QProgressBar::chunk {
+    background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+        stop:0 #E94560, stop:1 #FF6B81);
+    border-radius: 6px;
+}
+QGroupBox {
+    border: 2px solid #533483;
+    border-radius: 12px;
+    margin-top: 14px;
+    padding-top: 18px;
+    font-weight: bold;
+    color: #E94560;
+    background-color: #1A1A2E;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 16px;
+    padding: 0 8px;
+    color: #E94560;
+}
 QListWidget {
     background-color: #0F3460;
     color: #E0E0E0;
@@ -473,3 +483,76 @@ QRadioButton {
     color: #E0E0E0;
 }
 """
+
+# Library page chrome, applied once to the page instead of per widget so Qt
+# parses one sheet; widgets are matched by object name
+LIBRARY_PAGE = """
+QWidget#libraryHeader {
+    border-bottom: 2px solid #F8BBD0;
+}
+QLabel#appTitle {
+    font-size: 20px; font-weight: 800; color: #C2185B; background: transparent;
+}
+QLabel#countBadge {
+    font-size: 12px; color: #D81B60; font-weight: 600;
+    background: #FCE4EC; padding: 4px 14px; border-radius: 12px;
+}
+QLineEdit#librarySearch {
+    background-color: #F5F5F5; color: #2C2C2C;
+    border: 2px solid #E0E0E0; border-radius: 18px;
+    padding: 7px 18px; font-size: 13px;
+}
+QLineEdit#librarySearch:focus { border: 2px solid #F48FB1; background-color: #FFFFFF; }
+QLineEdit#librarySearch::placeholder { color: #BDBDBD; }
+QLabel#sortLabel {
+    color: #9E9E9E; font-weight: 600; font-size: 12px; background: transparent;
+}
+QComboBox#sortCombo {
+    background-color: #F5F5F5; border: 2px solid #E0E0E0;
+    border-radius: 14px; padding: 5px 14px; min-width: 120px; font-size: 12px;
+}
+QComboBox#sortCombo:hover { border-color: #F48FB1; }
+QPushButton#themeButton {
+    background-color: #F5F5F5; color: #757575; border: 2px solid #E0E0E0;
+    border-radius: 14px; padding: 6px 14px; font-size: 12px; font-weight: 600;
+    min-width: 50px;
+}
+QPushButton#themeButton:hover { border-color: #F48FB1; color: #D81B60; }
+QPushButton#addButton {
+    background-color: #EC407A; color: #FFFFFF; border: none;
+    border-radius: 16px; padding: 8px 22px; font-size: 13px; font-weight: bold;
+}
+QPushButton#addButton:hover { background-color: #D81B60; }
+QPushButton#addButton:pressed { background-color: #C2185B; }
+QScrollArea#libraryScroll { border: none; }
+QScrollArea#cwScroll { border: none; background: transparent; }
+QLabel#cwHeader, QLabel#librarySectionLabel {
+    font-size: 16px; font-weight: 700; color: #C2185B; background: transparent;
+}
+QLabel#librarySectionLabel { padding: 16px 24px 4px 24px; }
+QFrame#cwDivider { background-color: #F0F0F0; border: none; }
+QLabel#emptyIcon { font-size: 48px; background: transparent; color: #E0E0E0; }
+QLabel#emptyTitle {
+    font-size: 20px; font-weight: 700; color: #EC407A;
+    background: transparent; margin-top: 8px;
+}
+QLabel#emptySubtitle {
+    font-size: 14px; color: #9E9E9E; background: transparent; margin-top: 4px;
+}
+"""
+
+
+def _minify(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt has less to tokenize."""
+    qss = re.sub(r"/\*.*?\*/", "", qss, flags=re.DOTALL)
+    qss = re.sub(r"\s+", " ", qss)
+    qss = re.sub(r"\s*([{};,])\s*", r"\1", qss)
+    qss = re.sub(r":\s+", ":", qss)
+    return qss.strip()
+
+
+LIGHT_THEME = _minify(LIGHT_THEME)
+DARK_THEME = _minify(DARK_THEME)
+LIGHT_DIALOG = _minify(LIGHT_DIALOG)
+DARK_DIALOG = _minify(DARK_DIALOG)
+LIBRARY_PAGE = _minify(LIBRARY_PAGE)
@@ -4,7 +4,9 @@ Handles video compression with presets and progress reporting.
 Uses QThread + Qt Signals for reliable cross-thread communication.
 """
 
+import functools
 import os
+import queue
 import re
 import subprocess
 import shutil
@@ -61,13 +63,30 @@ PRESETS = {
         codec="copy", crf=None, audio_codec="copy", audio_bitrate="",
         extra_args=[]
     ),
+    "auto": CompressionPreset(
+        name="Auto",
+        description="Remux H.264/AAC sources without re-encoding, otherwise Balanced",
+        codec="auto", crf=None, audio_codec="auto", audio_bitrate="",
+        extra_args=[]
+    ),
 }
 
-PRESET_ORDER = ["copy", "lossless", "high", "balanced", "space_saver"]
+PRESET_ORDER = ["copy", "auto", "lossless", "high", "balanced", "space_saver"]
+
+# Used by "auto" when the source streams can go into an MP4 unchanged
+REMUX_PRESET = CompressionPreset(
+    name="Remux", description="Stream copy into MP4",
+    codec="copy", crf=None, audio_codec="copy", audio_bitrate="",
+    extra_args=["-movflags", "+faststart"]
+)
+REMUX_VIDEO_CODECS = {"h264"}
+REMUX_AUDIO_CODECS = {"aac", "mp3"}
 
 
+@functools.lru_cache(maxsize=1)
 def _detect_gpu_encoder() -> Optional[str]:
-    """Check if NVENC (NVIDIA) or QSV (Intel) hardware encoding is available."""
+    """Check if NVENC (NVIDIA) or QSV (Intel) hardware encoding is available.
+    Cached: the bundled ffmpeg's encoder list can't change while we run."""
     ffmpeg = get_ffmpeg_path()
     try:
         result = subprocess.run(
@@ -108,15 +127,35 @@ def _build_gpu_cmd(encoder: str, crf_equivalent: Optional[int],
     return cmd_parts
 
 
-def get_video_duration(input_path: str) -> Optional[float]:
+def _probe(input_path: str) -> str:
+    """Return the stream info ffmpeg prints for input_path. Cached per file
+    version so the subtitle scan, remux check and duration lookup share one
+    subprocess, while a file replaced at the same path is probed again."""
+    try:
+        st = os.stat(input_path)
+    except OSError:
+        return _run_probe(input_path)
+    return _probe_version(input_path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_version(input_path: str, mtime_ns: int, size: int) -> str:
+    return _run_probe(input_path)
+
+
+def _run_probe(input_path: str) -> str:
     ffmpeg = get_ffmpeg_path()
+    result = subprocess.run(
+        [ffmpeg, "-i", input_path],
+        stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
+        creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+    )
+    return result.stderr
+
+
+def get_video_duration(input_path: str) -> Optional[float]:
     try:
-        result = subprocess.run(
-            [ffmpeg, "-i", input_path],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
-            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-        )
-        match = re.search(r"Duration:\s*(\d+):(\d+):(\d+\.?\d*)", result.stderr)
+        match = re.search(r"Duration:\s*(\d+):(\d+):(\d+\.?\d*)", _probe(input_path))
         if match:
             h, m, s = int(match.group(1)), int(match.group(2)), float(match.group(3))
             return h * 3600 + m * 60 + s
@@ -125,19 +164,27 @@ def get_video_duration(input_path: str) -> Optional[float]:
     return None
 
 
+def can_remux_to_mp4(input_path: str) -> bool:
+    """True if the first video stream and every audio stream can be stream
+    copied into an MP4 (the streams the encoder maps)."""
+    try:
+        probe = _probe(input_path)
+    except Exception:
+        return False
+    video = re.findall(r"Stream #\d+:\d+.*?: Video: (\w+)", probe)
+    audio = re.findall(r"Stream #\d+:\d+.*?: Audio: (\w+)", probe)
+    return (bool(video) and video[0] in REMUX_VIDEO_CODECS
+            and all(codec in REMUX_AUDIO_CODECS for codec in audio))
+
+
 def get_embedded_subtitles(input_path: str) -> list:
-    ffmpeg = get_ffmpeg_path()
     try:
-        result = subprocess.run(
-            [ffmpeg, "-i", input_path],
-            stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True,
-            creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0)
-        )
+        stderr = _probe(input_path)
         subtitles = []
         pattern = re.compile(
             r"Stream #\d+:(\d+)(?:\((\w+)\))?: Subtitle: (\w+)"
         )
-        for match in pattern.finditer(result.stderr):
+        for match in pattern.finditer(stderr):
             track_idx = int(match.group(1))
             lang = match.group(2) or "Unknown"
             codec = match.group(3)
@@ -153,6 +200,21 @@ def get_embedded_subtitles(input_path: str) -> list:
         return []
 
 
+class SubtitleProbeThread(QThread):
+    """Runs get_embedded_subtitles off the GUI thread.
+    Emits the probed path with the result so callers can drop stale probes."""
+    finished_signal = Signal(str, list)
+
+    def __init__(self, input_path, parent=None):
+        super().__init__(parent)
+        self.input_path = input_path
+        self.subtitles = []
+
+    def run(self):
+        self.subtitles = get_embedded_subtitles(self.input_path)
+        self.finished_signal.emit(self.input_path, self.subtitles)
+
+
 class CompressionThread(QThread):
     """Background thread for video compression with Qt signal-based progress."""
     progress = Signal(float)
@@ -169,17 +231,32 @@ class CompressionThread(QThread):
         self._stderr_file = None
 
     def run(self):
+        self._compress()
+
+    def _report_progress(self, percent):
+        self.progress.emit(percent)
+
+    def _report_finished(self, success, message):
+        self.finished_signal.emit(success, message)
+
+    def _compress(self):
         preset = self.preset
 
+        # Auto: remux when no stream needs re-encoding
+        if preset.codec == "auto":
+            if can_remux_to_mp4(self.input_path):
+                preset = REMUX_PRESET
+            else:
+                preset = PRESETS["balanced"]
         # Handle simple copy mode
-        if preset.codec == "copy":
+        elif preset.codec == "copy":
             try:
-                self.progress.emit(0.0)
+                self._report_progress(0.0)
                 shutil.copy2(self.input_path, self.output_path)
-                self.progress.emit(100.0)
-                self.finished_signal.emit(True, "File copied successfully.")
+                self._report_progress(100.0)
+                self._report_finished(True, "File copied successfully.")
             except Exception as e:
-                self.finished_signal.emit(False, str(e))
+                self._report_finished(False, str(e))
             return
 
         ffmpeg = get_ffmpeg_path()
@@ -241,7 +318,7 @@ class CompressionThread(QThread):
                 if self._cancelled:
                     self._process.terminate()
                     self._cleanup()
-                    self.finished_signal.emit(False, "Compression cancelled.")
+                    self._report_finished(False, "Compression cancelled.")
                     return False
 
                 if line.startswith("out_time_ms="):
@@ -250,15 +327,15 @@ class CompressionThread(QThread):
                         current_seconds = time_us / 1_000_000
                         if duration and duration > 0:
                             percent = min((current_seconds / duration) * 100, 99.9)
-                            self.progress.emit(percent)
+                            self._report_progress(percent)
                     except (ValueError, ZeroDivisionError):
                         pass
 
             self._process.wait()
 
             if self._process.returncode == 0:
-                self.progress.emit(100.0)
-                self.finished_signal.emit(True, "Compression complete.")
+                self._report_progress(100.0)
+                self._report_finished(True, "Compression complete.")
                 return True
             else:
                 # Read the error from temp log
@@ -277,18 +354,18 @@ class CompressionThread(QThread):
                 self._cleanup()
                 error_msg = stderr.strip().split('\n')
                 last_lines = '\n'.join(error_msg[-10:])
-                self.finished_signal.emit(
+                self._report_finished(
                     False, f"FFmpeg error:\n{last_lines[-500:]}")
                 return False
 
         except FileNotFoundError:
-            self.finished_signal.emit(
+            self._report_finished(
                 False, "FFmpeg not found. Please ensure FFmpeg is available.")
             return False
         except Exception as e:
             if not self._use_gpu:
                 self._cleanup()
-                self.finished_signal.emit(False, f"Error: {str(e)}")
+                self._report_finished(False, f"Error: {str(e)}")
             return False
         finally:
             self._process = None
@@ -316,3 +393,31 @@ class CompressionThread(QThread):
                 os.remove(self.output_path)
         except Exception:
             pass
+
+
+class EncoderQueueThread(CompressionThread):
+    """Long-lived worker that compresses (index, input, output) jobs from a
+    shared queue with one preset, until it pulls a None sentinel.
+    Signals carry the job index since several workers can share a queue."""
+    job_progress = Signal(int, float)
+    job_finished = Signal(int, bool, str)
+
+    def __init__(self, jobs: queue.Queue, preset, parent=None):
+        super().__init__("", "", preset, parent)
+        self.jobs = jobs
+        self.index = -1
+
+    def run(self):
+        while not self._cancelled:
+            job = self.jobs.get()
+            if job is None:
+                return
+            self.index, self.input_path, self.output_path = job
+            self._use_gpu = False
+            self._compress()
+
+    def _report_progress(self, percent):
+        self.job_progress.emit(self.index, percent)
+
+    def _report_finished(self, success, message):
+        self.job_finished.emit(self.index, success, message)
@@ -4,9 +4,14 @@ All paths are resolved relative to the drive root so the app
 works regardless of which drive letter/mount point is used.
 """
 
+import functools
 import os
+import re
 import sys
 
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[\s_-]+')
+
 
 def normalize_path(rel_path: str) -> str:
     """Convert Windows backslashes to forward slashes for cross-platform."""
@@ -41,6 +46,7 @@ def get_drive_root() -> str:
         return get_app_root()
 
 
+@functools.lru_cache(maxsize=1)
 def get_library_root() -> str:
     path = os.path.join(get_drive_root(), "library")
     os.makedirs(path, exist_ok=True)
@@ -84,14 +90,60 @@ def make_movie_dir(slug: str) -> str:
 
 
 def slugify(title: str) -> str:
-    import re
     slug = title.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
+    slug = _SLUG_SEP_RE.sub('-', slug)
     slug = slug.strip('-')
     return slug or "untitled"
 
 
+# ioctl number for FICLONE (copy-on-write clone) on Linux
+_FICLONE = 0x40049409
+
+
+def _reflink(src: str, dest: str) -> bool:
+    """Clone src into dest on Btrfs/XFS; False where unsupported."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        try:
+            os.remove(dest)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def stage_file(src: str, dest: str):
+    """Hardlink src to dest when both live on the same volume, else reflink
+    on copy-on-write filesystems, else copy. shutil.copy2 already copies in
+    the kernel (sendfile on Linux, fcopyfile on macOS)."""
+    import shutil
+    try:
+        os.link(src, dest)
+        return
+    except OSError:
+        pass
+    if _reflink(src, dest):
+        shutil.copystat(src, dest)
+        return
+    shutil.copy2(src, dest)
+
+
+def remove_replaced_file(old: str, new: str):
+    """Delete old now that new supersedes it, unless both name the same file
+    (poster.JPG and poster.jpg on a case-insensitive drive)."""
+    try:
+        if os.path.exists(old) and not os.path.samefile(old, new):
+            os.remove(old)
+    except OSError:
+        pass
+
+
 def get_drive_free_space() -> int:
     import shutil
     usage = shutil.disk_usage(get_drive_root())
@@ -0,0 +1,84 @@
+"""
+Poster thumbnail generation for BebeFlix.
+Posters are downscaled once at import time so the library grid never
+has to decode full-resolution artwork.
+"""
+
+import os
+
+from PySide6.QtCore import Qt, QThread
+from PySide6.QtGui import QImage
+
+from utils.paths import get_library_root, normalize_path, stage_file, remove_replaced_file
+
+# 2x the grid poster size (180x270) so cards stay sharp on HiDPI screens
+THUMB_WIDTH = 360
+THUMB_HEIGHT = 540
+THUMB_QUALITY = 85
+
+MIGRATION_SETTING = "poster_thumbs_v1"
+
+
+def _save_thumbnail(image: QImage, dest: str) -> bool:
+    if image.width() > THUMB_WIDTH or image.height() > THUMB_HEIGHT:
+        image = image.scaled(THUMB_WIDTH, THUMB_HEIGHT,
+            Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    return image.save(dest, "JPEG", THUMB_QUALITY)
+
+
+def make_poster_thumbnail(src: str, dest_dir: str, stem: str) -> str:
+    """Write a downscaled JPEG of src into dest_dir and return its path.
+    Falls back to copying the original if Qt can't decode it."""
+    image = QImage(src)
+    if not image.isNull():
+        dest = os.path.join(dest_dir, f"{stem}.jpg")
+        if _save_thumbnail(image, dest):
+            return dest
+
+    dest = os.path.join(dest_dir, f"{stem}{os.path.splitext(src)[1]}")
+    stage_file(src, dest)
+    return dest
+
+
+class PosterMigrationThread(QThread):
+    """One-shot background pass that shrinks posters imported before
+    thumbnails were generated at import time."""
+
+    def __init__(self, db, parent=None):
+        super().__init__(parent)
+        self.db = db
+
+    def run(self):
+        root = get_library_root()
+        for kind, item_id, thumb_rel in self.db.get_thumb_paths():
+            if self.isInterruptionRequested():
+                return
+            src = os.path.join(root, normalize_path(thumb_rel))
+            image = QImage(src)
+            if image.isNull():
+                continue
+            if image.width() <= THUMB_WIDTH and image.height() <= THUMB_HEIGHT:
+                continue
+            dest = os.path.splitext(src)[0] + ".jpg"
+            # dest may be src itself; write beside it so an unplugged drive
+            # never leaves the only copy half-written
+            tmp = dest + ".tmp"
+            try:
+                saved = _save_thumbnail(image, tmp)
+                if saved:
+                    os.replace(tmp, dest)
+            except OSError:
+                saved = False
+            if not saved:
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+                continue
+            rel = os.path.relpath(dest, root)
+            if kind == "movie":
+                self.db.update_movie_thumb(item_id, rel)
+            else:
+                self.db.update_show_thumb(item_id, rel)
+            remove_replaced_file(src, dest)
+        self.db.set_setting(MIGRATION_SETTING, "1")
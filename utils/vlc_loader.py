@@ -0,0 +1,44 @@
+"""
+Deferred libvlc loading for BebeFlix.
+python-vlc opens libvlc as soon as it is imported, so the import (and the
+bundled-library preload it depends on) waits until something is played.
+"""
+
+import os
+import sys
+
+_vlc = None
+_attempted = False
+
+
+def _preload_bundled_libs():
+    """Preload libvlc via ctypes so python-vlc finds it in a frozen macOS build
+    (DYLD_LIBRARY_PATH doesn't work when set from within the process)."""
+    if not getattr(sys, 'frozen', False) or sys.platform != "darwin":
+        return
+    vlc_dir = os.path.join(os.path.dirname(os.path.abspath(sys.executable)), "vlc")
+    if not os.path.isdir(vlc_dir):
+        return
+    import ctypes
+    for lib_name in ["libvlccore.dylib", "libvlc.dylib"]:
+        lib_path = os.path.join(vlc_dir, lib_name)
+        if os.path.isfile(lib_path):
+            try:
+                ctypes.cdll.LoadLibrary(lib_path)
+            except OSError:
+                pass
+
+
+def load_vlc():
+    """Import and return the vlc module on first call, or None if VLC
+    can't be loaded. Later calls return the cached result."""
+    global _vlc, _attempted
+    if not _attempted:
+        _attempted = True
+        _preload_bundled_libs()
+        try:
+            import vlc
+            _vlc = vlc
+        except (ImportError, OSError):
+            _vlc = None
+    return _vlc